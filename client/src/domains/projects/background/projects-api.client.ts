@@ -5,12 +5,27 @@ import type {
 } from '../../../entities/project/model/types';
 import { requestAuthorizedJson } from '../../../shared/api/authorized-api.client';
 
+// Matches the server's MAX_PAGE_SIZE so long lists take as few requests as possible.
+const PROJECT_PAGE_SIZE = 500;
+
 export async function fetchProjects(): Promise<Project[]> {
-  const response = await requestAuthorizedJson<ProjectListResponse>('/projects', {
-    method: 'GET',
-  });
+  const projects: Project[] = [];
+  let cursor: string | null | undefined;
+
+  do {
+    const query = new URLSearchParams({ limit: String(PROJECT_PAGE_SIZE) });
+    if (cursor) {
+      query.set('cursor', cursor);
+    }
+
+    const response = await requestAuthorizedJson<ProjectListResponse>(`/projects?${query}`, {
+      method: 'GET',
+    });
+    projects.push(...response.items);
+    cursor = response.next_cursor;
+  } while (cursor);
 
-  return response.items;
+  return projects;
 }
 
 export async function createProject(payload: ProjectCreatePayload): Promise<Project> {
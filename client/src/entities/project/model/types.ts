@@ -7,6 +7,7 @@ export interface Project {
 
 export interface ProjectListResponse {
   items: Project[];
+  next_cursor?: string | null;
 }
 
 export interface ProjectCreatePayload {
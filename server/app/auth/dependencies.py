@@ -1,10 +1,16 @@
 from functools import lru_cache
 
-from app.auth.factory import build_auth_service
+from app.auth.factory import build_auth_service, build_keycloak_token_verifier
+from app.auth.infrastructure.keycloak_token_verifier import KeycloakTokenVerifier
 from app.auth.services.auth_service import AuthService
 from app.core.dependencies import get_settings
 
 
+@lru_cache
+def get_token_verifier() -> KeycloakTokenVerifier:
+    return build_keycloak_token_verifier(get_settings())
+
+
 @lru_cache
 def get_auth_service() -> AuthService:
-    return build_auth_service(get_settings())
+    return build_auth_service(get_settings(), token_verifier=get_token_verifier())
@@ -1,15 +1,229 @@
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Literal, NoReturn, Protocol
+
 from app.auth.domain.exceptions import ForbiddenError
 from app.auth.domain.principal import AuthenticatedPrincipal
 
+AccessPolicyName = Literal["default", "projects", "browser_control", "chat"]
+
+DEFAULT_DECISION_CACHE_SIZE = 4096
+
+_TOKEN_PATTERN = re.compile(r"\(|\)|&&|\|\||!|[^\s()!&|]+")
+
+
+class AccessPredicate(Protocol):
+    def evaluate(self, principal: AuthenticatedPrincipal) -> bool:
+        ...
+
+
+@dataclass(slots=True, frozen=True)
+class RolePredicate:
+    role: str
+
+    def evaluate(self, principal: AuthenticatedPrincipal) -> bool:
+        return self.role in principal.normalized_roles
+
+    def __str__(self) -> str:
+        return f"role:{self.role}"
+
+
+@dataclass(slots=True, frozen=True)
+class GroupPredicate:
+    group: str
+    # "/org/team" must be the full path; "team" may end any path ("/org/team").
+    absolute: bool
+
+    def evaluate(self, principal: AuthenticatedPrincipal) -> bool:
+        if self.absolute:
+            return self.group in principal.normalized_groups
+        return self.group in principal.group_path_suffixes
+
+    def __str__(self) -> str:
+        return f"group:{'/' if self.absolute else ''}{self.group}"
+
+
+@dataclass(slots=True, frozen=True)
+class GroupSubtreePredicate:
+    parent_group: str
+    # Same anchoring as GroupPredicate: "/team/*" only under the top-level "/team".
+    absolute: bool
+
+    def evaluate(self, principal: AuthenticatedPrincipal) -> bool:
+        prefix = f"{self.parent_group}/"
+        groups = principal.normalized_groups if self.absolute else principal.group_path_suffixes
+        return any(group.startswith(prefix) for group in groups)
+
+    def __str__(self) -> str:
+        return f"group:{'/' if self.absolute else ''}{self.parent_group}/*"
+
+
+@dataclass(slots=True, frozen=True)
+class ActiveClaimPredicate:
+    def evaluate(self, principal: AuthenticatedPrincipal) -> bool:
+        return principal.active_claim is True
+
+    def __str__(self) -> str:
+        return "active"
+
+
+@dataclass(slots=True, frozen=True)
+class AllOf:
+    predicates: tuple[AccessPredicate, ...]
+
+    def evaluate(self, principal: AuthenticatedPrincipal) -> bool:
+        return all(predicate.evaluate(principal) for predicate in self.predicates)
+
+    def __str__(self) -> str:
+        return "(" + " and ".join(str(predicate) for predicate in self.predicates) + ")"
+
+
+@dataclass(slots=True, frozen=True)
+class AnyOf:
+    predicates: tuple[AccessPredicate, ...]
+
+    def evaluate(self, principal: AuthenticatedPrincipal) -> bool:
+        return any(predicate.evaluate(principal) for predicate in self.predicates)
+
+    def __str__(self) -> str:
+        return "(" + " or ".join(str(predicate) for predicate in self.predicates) + ")"
+
+
+@dataclass(slots=True, frozen=True)
+class Not:
+    predicate: AccessPredicate
+
+    def evaluate(self, principal: AuthenticatedPrincipal) -> bool:
+        return not self.predicate.evaluate(principal)
+
+    def __str__(self) -> str:
+        return f"not {self.predicate}"
+
+
+class _PolicyParser:
+    """Recursive-descent parser for `or` > `and` > `not` > atom expressions.
+
+    Atoms: `role:<name>`, `any_role:<a>,<b>`, `group:<path>`, `group:<path>/*`
+    and `active`. A group path with a leading `/` is absolute; without one it
+    matches the trailing segments of a group path. `&&`/`||`/`!` are accepted as operator aliases.
+    """
+
+    def __init__(self, expression: str) -> None:
+        self._expression = expression
+        self._tokens = _TOKEN_PATTERN.findall(expression)
+        self._position = 0
+
+    def parse(self) -> AccessPredicate:
+        if not self._tokens:
+            raise ValueError("Access policy expression is empty.")
+        predicate = self._parse_or()
+        if self._position != len(self._tokens):
+            self._fail(f"unexpected '{self._tokens[self._position]}'")
+        return predicate
+
+    def _peek(self) -> str | None:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return None
+
+    def _take(self) -> str:
+        token = self._peek()
+        if token is None:
+            self._fail("unexpected end of expression")
+        self._position += 1
+        return token
+
+    def _parse_or(self) -> AccessPredicate:
+        predicates = [self._parse_and()]
+        while (self._peek() or "").lower() in {"or", "||"}:
+            self._take()
+            predicates.append(self._parse_and())
+        return predicates[0] if len(predicates) == 1 else AnyOf(tuple(predicates))
+
+    def _parse_and(self) -> AccessPredicate:
+        predicates = [self._parse_not()]
+        while (self._peek() or "").lower() in {"and", "&&"}:
+            self._take()
+            predicates.append(self._parse_not())
+        return predicates[0] if len(predicates) == 1 else AllOf(tuple(predicates))
+
+    def _parse_not(self) -> AccessPredicate:
+        if (self._peek() or "").lower() in {"not", "!"}:
+            self._take()
+            return Not(self._parse_not())
+        return self._parse_atom()
+
+    def _parse_atom(self) -> AccessPredicate:
+        token = self._take()
+        if token == "(":
+            predicate = self._parse_or()
+            if self._take() != ")":
+                self._fail("missing ')'")
+            return predicate
+
+        kind, _, argument = token.partition(":")
+        kind = kind.lower()
+        argument = argument.strip().lower()
+        if kind == "active" and not argument:
+            return ActiveClaimPredicate()
+        if kind == "role" and argument:
+            return RolePredicate(argument)
+        if kind == "any_role" and argument:
+            roles = tuple(RolePredicate(role) for role in argument.split(",") if role)
+            return roles[0] if len(roles) == 1 else AnyOf(roles)
+        if kind == "group" and argument.strip("/*"):
+            absolute = argument.startswith("/")
+            group = argument.lstrip("/")
+            if group.endswith("/*"):
+                return GroupSubtreePredicate(group[:-2].rstrip("/"), absolute)
+            return GroupPredicate(group.rstrip("/"), absolute)
+        self._fail(f"unknown term '{token}'")
+
+    def _fail(self, reason: str) -> NoReturn:
+        raise ValueError(f"Invalid access policy '{self._expression}': {reason}.")
+
+
+def compile_access_policy_expression(expression: str) -> AccessPredicate:
+    return _PolicyParser(expression).parse()
+
+
+class AccessPolicy:
+    def __init__(
+        self,
+        expression: str,
+        *,
+        decision_cache_size: int = DEFAULT_DECISION_CACHE_SIZE,
+    ) -> None:
+        self._predicate = compile_access_policy_expression(expression)
+        self._description = str(self._predicate)
+        if isinstance(self._predicate, RolePredicate):
+            self._denied_message = f"User must have '{self._predicate.role}' role."
+        else:
+            self._denied_message = f"User does not satisfy access policy '{self._description}'."
+        self._decision_cache_size = max(0, decision_cache_size)
+        self._decisions: OrderedDict[tuple[object, ...], bool] = OrderedDict()
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    def is_allowed(self, principal: AuthenticatedPrincipal) -> bool:
+        fingerprint = principal.fingerprint
+        decision = self._decisions.get(fingerprint)
+        if decision is not None:
+            self._decisions.move_to_end(fingerprint)
+            return decision
 
-class RoleAccessPolicy:
-    def __init__(self, required_role: str = "active") -> None:
-        self._required_role = required_role.strip().lower()
+        decision = self._predicate.evaluate(principal)
+        if self._decision_cache_size:
+            self._decisions[fingerprint] = decision
+            if len(self._decisions) > self._decision_cache_size:
+                self._decisions.popitem(last=False)
+        return decision
 
-    def ensure_required_role(self, principal: AuthenticatedPrincipal) -> None:
-        if not self._required_role:
-            raise ForbiddenError("Required active role is not configured.")
-        if not principal.has_role(self._required_role):
-            raise ForbiddenError(
-                f"User must have '{self._required_role}' role."
-            )
+    def ensure_allowed(self, principal: AuthenticatedPrincipal) -> None:
+        if not self.is_allowed(principal):
+            raise ForbiddenError(self._denied_message)
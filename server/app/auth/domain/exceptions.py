@@ -13,3 +13,6 @@ class ForbiddenError(AuthError):
 class IdentityProviderUnavailableError(AuthError):
     """Raised when upstream identity provider metadata/JWKS is unavailable."""
 
+
+class AuthOverloadedError(AuthError):
+    """Raised when token verification capacity is exhausted."""
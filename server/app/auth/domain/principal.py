@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(slots=True, frozen=True)
@@ -10,6 +10,39 @@ class AuthenticatedPrincipal:
     groups: frozenset[str]
     roles: frozenset[str]
     active_claim: bool | None
+    normalized_roles: frozenset[str] = field(init=False, repr=False, compare=False)
+    normalized_groups: frozenset[str] = field(init=False, repr=False, compare=False)
+    # Every "/"-bounded suffix of every group path, so "/org/team" matches "team".
+    group_path_suffixes: frozenset[str] = field(init=False, repr=False, compare=False)
+    # Everything access policies look at; used as the policy decision cache key.
+    fingerprint: tuple[object, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        normalized_groups = frozenset(
+            group
+            for group in (self._normalize(raw).lstrip("/") for raw in self.groups)
+            if group
+        )
+        suffixes: set[str] = set()
+        for group in normalized_groups:
+            suffixes.add(group)
+            separator = group.find("/")
+            while separator != -1:
+                suffix = group[separator + 1:]
+                if suffix:
+                    suffixes.add(suffix)
+                separator = group.find("/", separator + 1)
+
+        normalized_roles = frozenset(self._normalize(role) for role in self.roles)
+
+        object.__setattr__(self, "normalized_roles", normalized_roles)
+        object.__setattr__(self, "normalized_groups", normalized_groups)
+        object.__setattr__(self, "group_path_suffixes", frozenset(suffixes))
+        object.__setattr__(
+            self,
+            "fingerprint",
+            (normalized_roles, normalized_groups, self.active_claim),
+        )
 
     @staticmethod
     def _normalize(value: str) -> str:
@@ -19,18 +52,13 @@ class AuthenticatedPrincipal:
         target = self._normalize(expected_group).lstrip("/")
         if not target:
             return False
-
-        for group in self.groups:
-            candidate = self._normalize(group).lstrip("/")
-            if candidate == target or candidate.endswith(f"/{target}"):
-                return True
-        return False
+        return target in self.group_path_suffixes
 
     def has_role(self, expected_role: str) -> bool:
         target = self._normalize(expected_role)
         if not target:
             return False
-        return any(self._normalize(role) == target for role in self.roles)
+        return target in self.normalized_roles
 
     def active_state_from_roles(
         self,
@@ -42,4 +70,3 @@ class AuthenticatedPrincipal:
         if self.has_role(active_role_false):
             return False
         return self.active_claim
-
@@ -6,3 +6,9 @@ from app.auth.domain.principal import AuthenticatedPrincipal
 class TokenVerifier(Protocol):
     async def verify_access_token(self, access_token: str) -> AuthenticatedPrincipal:
         ...
+
+    async def start(self) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
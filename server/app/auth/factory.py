@@ -1,25 +1,47 @@
-from app.auth.domain.access_policy import RoleAccessPolicy
+from app.auth.domain.access_policy import AccessPolicy, AccessPolicyName
+from app.auth.domain.token_verifier import TokenVerifier
+from app.auth.infrastructure.jwks_snapshot import JwksSnapshotStore
 from app.auth.infrastructure.keycloak_token_verifier import KeycloakTokenVerifier
 from app.auth.services.auth_service import AuthService
 from app.core.settings import Settings
 
 
 def build_keycloak_token_verifier(settings: Settings) -> KeycloakTokenVerifier:
+    snapshot_path = settings.keycloak_jwks_snapshot_path.strip()
     return KeycloakTokenVerifier(
         issuer=settings.issuer_url,
         audience=settings.keycloak_audience,
         oidc_config_url=settings.oidc_config_url,
         verify_ssl=settings.keycloak_verify_ssl,
         jwks_cache_ttl_seconds=settings.keycloak_jwks_cache_ttl_seconds,
+        jwks_refresh_ahead_seconds=settings.keycloak_jwks_refresh_ahead_seconds,
+        jwks_max_staleness_seconds=settings.keycloak_jwks_max_staleness_seconds,
+        jwks_snapshot_store=JwksSnapshotStore(snapshot_path) if snapshot_path else None,
+        http_max_connections=settings.keycloak_http_max_connections,
+        jwks_min_forced_refresh_interval_seconds=(
+            settings.keycloak_jwks_min_forced_refresh_interval_seconds
+        ),
+        unknown_key_id_cache_ttl_seconds=settings.keycloak_unknown_kid_cache_ttl_seconds,
+        jwt_execution_mode=settings.auth_jwt_execution_mode,
+        jwt_executor_max_workers=settings.auth_jwt_executor_max_workers,
+        jwt_executor_max_pending=settings.auth_jwt_executor_max_pending,
+        token_cache_max_entries=settings.auth_token_cache_max_entries,
+        token_cache_max_ttl_seconds=settings.auth_token_cache_max_ttl_seconds,
     )
 
 
-def build_access_policy(settings: Settings) -> RoleAccessPolicy:
-    return RoleAccessPolicy(required_role=settings.required_role)
+def build_access_policies(settings: Settings) -> dict[AccessPolicyName, AccessPolicy]:
+    return {
+        name: AccessPolicy(
+            expression,
+            decision_cache_size=settings.auth_policy_decision_cache_size,
+        )
+        for name, expression in settings.access_policy_expressions().items()
+    }
 
 
-def build_auth_service(settings: Settings) -> AuthService:
+def build_auth_service(settings: Settings, *, token_verifier: TokenVerifier) -> AuthService:
     return AuthService(
-        token_verifier=build_keycloak_token_verifier(settings),
-        access_policy=build_access_policy(settings),
+        token_verifier=token_verifier,
+        access_policies=build_access_policies(settings),
     )
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from itertools import count
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from jose import jwk
+from jose.backends.base import Key
+from jose.exceptions import JOSEError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIGNING_ALGORITHM = "RS256"
+
+_index_versions = count(1)
+
+
+@dataclass(slots=True, frozen=True)
+class JwkKeyIndex:
+    """Immutable (kid, alg) -> public key lookup built once per JWKS fetch."""
+
+    keys: Mapping[tuple[str, str], Key]
+    unnamed_keys: Mapping[str, Key]
+    # Raw payload and a per-process version let worker processes rebuild the
+    # same index once instead of receiving unpicklable key objects.
+    version: int
+    jwks: dict[str, Any]
+
+    @classmethod
+    def empty(cls) -> JwkKeyIndex:
+        return cls(
+            keys=MappingProxyType({}),
+            unnamed_keys=MappingProxyType({}),
+            version=next(_index_versions),
+            jwks={"keys": []},
+        )
+
+    @classmethod
+    def from_jwks(
+        cls,
+        jwks: dict[str, Any],
+        *,
+        default_algorithm: str = DEFAULT_SIGNING_ALGORITHM,
+    ) -> JwkKeyIndex:
+        raw_keys = jwks.get("keys", [])
+        if not isinstance(raw_keys, list):
+            return cls.empty()
+
+        keys: dict[tuple[str, str], Key] = {}
+        keys_by_algorithm: dict[str, list[Key]] = {}
+        for raw_key in raw_keys:
+            if not isinstance(raw_key, dict) or raw_key.get("use", "sig") != "sig":
+                continue
+
+            algorithm = raw_key.get("alg") or default_algorithm
+            if not isinstance(algorithm, str):
+                continue
+            key_id = raw_key.get("kid")
+            try:
+                public_key = jwk.construct(raw_key, algorithm)
+            except (JOSEError, ValueError, TypeError, KeyError) as error:
+                # One malformed entry must not take down the keys next to it.
+                logger.warning("Skipping invalid JWKS key %r (%s): %s", key_id, algorithm, error)
+                continue
+
+            if isinstance(key_id, str) and key_id:
+                keys[(key_id, algorithm)] = public_key
+            keys_by_algorithm.setdefault(algorithm, []).append(public_key)
+
+        # Tokens without kid are only accepted when the choice is unambiguous.
+        unnamed_keys = {
+            algorithm: candidates[0]
+            for algorithm, candidates in keys_by_algorithm.items()
+            if len(candidates) == 1
+        }
+        return cls(
+            keys=MappingProxyType(keys),
+            unnamed_keys=MappingProxyType(unnamed_keys),
+            version=next(_index_versions),
+            jwks=jwks,
+        )
+
+    def find(self, key_id: str | None, algorithm: str) -> Key | None:
+        if key_id:
+            return self.keys.get((key_id, algorithm))
+        return self.unnamed_keys.get(algorithm)
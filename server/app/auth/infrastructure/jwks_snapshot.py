@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, frozen=True)
+class JwksSnapshot:
+    oidc_config: dict[str, Any]
+    jwks: dict[str, Any]
+    fetched_at: float
+
+
+class JwksSnapshotStore:
+    """Last known good OIDC config + JWKS on local disk, for warm starts."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+
+    def load(self) -> JwksSnapshot | None:
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logger.warning("Ignoring unreadable JWKS snapshot %s: %s", self._path, error)
+            return None
+
+        oidc_config = payload.get("oidc_config") if isinstance(payload, dict) else None
+        jwks = payload.get("jwks") if isinstance(payload, dict) else None
+        fetched_at = payload.get("fetched_at") if isinstance(payload, dict) else None
+        if (
+            not isinstance(oidc_config, dict)
+            or not isinstance(jwks, dict)
+            or not isinstance(fetched_at, (int, float))
+        ):
+            logger.warning("Ignoring malformed JWKS snapshot %s.", self._path)
+            return None
+        return JwksSnapshot(oidc_config=oidc_config, jwks=jwks, fetched_at=float(fetched_at))
+
+    def save(self, snapshot: JwksSnapshot) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self._path.with_name(f".{self._path.name}.{os.getpid()}.tmp")
+        temporary_path.write_text(
+            json.dumps(
+                {
+                    "oidc_config": snapshot.oidc_config,
+                    "jwks": snapshot.jwks,
+                    "fetched_at": snapshot.fetched_at,
+                }
+            ),
+            encoding="utf-8",
+        )
+        # Atomic swap so concurrent workers never read a half-written file.
+        os.replace(temporary_path, self._path)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from jose import JWTError, jwt
+
+from app.auth.domain.exceptions import AuthOverloadedError
+from app.auth.infrastructure.jwk_key_index import JwkKeyIndex
+
+JwtExecutionMode = Literal["inline", "thread", "process"]
+
+# Worker-process state: the key index for the parent's latest JWKS version.
+_worker_key_index: tuple[int, JwkKeyIndex] | None = None
+
+
+class _KeyIndexVersionMiss(Exception):
+    """The worker does not hold the requested JWKS version; resend with the JWKS."""
+
+
+def decode_claims(
+    access_token: str,
+    key_index: JwkKeyIndex,
+    *,
+    key_id: str | None,
+    algorithm: str,
+    issuer: str,
+    audience: str | None,
+) -> dict[str, Any]:
+    public_key = key_index.find(key_id, algorithm)
+    if public_key is None:
+        raise JWTError("Token signing key is not in the Keycloak JWKS.")
+
+    return jwt.decode(
+        access_token,
+        public_key,
+        algorithms=[algorithm],
+        issuer=issuer,
+        audience=audience,
+        options={"verify_aud": audience is not None},
+    )
+
+
+def _load_worker_key_index(version: int, jwks: dict[str, Any]) -> JwkKeyIndex:
+    global _worker_key_index
+    if _worker_key_index is None or _worker_key_index[0] != version:
+        _worker_key_index = (version, JwkKeyIndex.from_jwks(jwks))
+    return _worker_key_index[1]
+
+
+def _decode_in_worker(
+    access_token: str,
+    key_index_version: int,
+    jwks: dict[str, Any] | None,
+    key_id: str | None,
+    algorithm: str,
+    issuer: str,
+    audience: str | None,
+) -> dict[str, Any]:
+    if jwks is None:
+        if _worker_key_index is None or _worker_key_index[0] != key_index_version:
+            raise _KeyIndexVersionMiss(key_index_version)
+        key_index = _worker_key_index[1]
+    else:
+        key_index = _load_worker_key_index(key_index_version, jwks)
+    return decode_claims(
+        access_token,
+        key_index,
+        key_id=key_id,
+        algorithm=algorithm,
+        issuer=issuer,
+        audience=audience,
+    )
+
+
+class JwtDecodeExecutor:
+    """Runs RS256 signature checks inline, in a thread pool or in worker processes."""
+
+    def __init__(
+        self,
+        *,
+        mode: JwtExecutionMode,
+        max_workers: int,
+        max_pending: int,
+        issuer: str,
+        audience: str | None,
+    ) -> None:
+        self._mode = mode
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._issuer = issuer
+        self._audience = audience
+        self._pending = 0
+        self._executor: Executor | None = None
+
+    @property
+    def mode(self) -> JwtExecutionMode:
+        return self._mode
+
+    async def decode(
+        self,
+        access_token: str,
+        key_index: JwkKeyIndex,
+        *,
+        key_id: str | None,
+        algorithm: str,
+    ) -> dict[str, Any]:
+        if self._mode == "inline":
+            return decode_claims(
+                access_token,
+                key_index,
+                key_id=key_id,
+                algorithm=algorithm,
+                issuer=self._issuer,
+                audience=self._audience,
+            )
+
+        if self._pending >= self._max_pending:
+            raise AuthOverloadedError("Too many access tokens are waiting for verification.")
+
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        try:
+            if self._mode == "thread":
+                return await loop.run_in_executor(
+                    self._get_executor(key_index),
+                    lambda: decode_claims(
+                        access_token,
+                        key_index,
+                        key_id=key_id,
+                        algorithm=algorithm,
+                        issuer=self._issuer,
+                        audience=self._audience,
+                    ),
+                )
+            executor = self._get_executor(key_index)
+            # Workers cache the key index by version, so the JWKS itself is only
+            # pickled again for a worker that has not seen this version yet.
+            try:
+                return await loop.run_in_executor(
+                    executor,
+                    _decode_in_worker,
+                    access_token,
+                    key_index.version,
+                    None,
+                    key_id,
+                    algorithm,
+                    self._issuer,
+                    self._audience,
+                )
+            except _KeyIndexVersionMiss:
+                return await loop.run_in_executor(
+                    executor,
+                    _decode_in_worker,
+                    access_token,
+                    key_index.version,
+                    key_index.jwks,
+                    key_id,
+                    algorithm,
+                    self._issuer,
+                    self._audience,
+                )
+        finally:
+            self._pending -= 1
+
+    def _get_executor(self, key_index: JwkKeyIndex) -> Executor:
+        if self._executor is None:
+            if self._mode == "thread":
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="jwt-decode",
+                )
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_load_worker_key_index,
+                    initargs=(key_index.version, key_index.jwks),
+                )
+        return self._executor
+
+    def close(self) -> None:
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from time import monotonic
+import asyncio
+import logging
+from contextlib import suppress
+from time import monotonic, time
 from typing import Any
 
 import httpx
@@ -11,6 +14,31 @@ from app.auth.domain.exceptions import (
     UnauthorizedError,
 )
 from app.auth.domain.principal import AuthenticatedPrincipal
+from app.auth.infrastructure.jwk_key_index import DEFAULT_SIGNING_ALGORITHM, JwkKeyIndex
+from app.auth.infrastructure.jwks_snapshot import JwksSnapshot, JwksSnapshotStore
+from app.auth.infrastructure.jwt_decode_executor import JwtDecodeExecutor, JwtExecutionMode
+from app.auth.infrastructure.unknown_key_id_cache import UnknownKeyIdCache
+from app.auth.infrastructure.verified_token_cache import (
+    VerifiedTokenCache,
+    VerifiedTokenCacheStats,
+)
+
+logger = logging.getLogger(__name__)
+
+IDP_HTTP_TIMEOUT_SECONDS = 10.0
+JWKS_REFRESH_RETRY_SECONDS = 5.0
+UNKNOWN_KEY_ID_CACHE_MAX_ENTRIES = 1024
+
+
+def _json_object(response: httpx.Response, invalid_message: str) -> dict[str, Any]:
+    # A 200 from a proxy error page is still an outage, not a server bug.
+    try:
+        payload = response.json()
+    except ValueError as error:
+        raise IdentityProviderUnavailableError(invalid_message) from error
+    if not isinstance(payload, dict):
+        raise IdentityProviderUnavailableError(invalid_message)
+    return payload
 
 
 class KeycloakTokenVerifier:
@@ -22,6 +50,18 @@ class KeycloakTokenVerifier:
         oidc_config_url: str,
         verify_ssl: bool,
         jwks_cache_ttl_seconds: int = 300,
+        jwks_refresh_ahead_seconds: int = 30,
+        jwks_max_staleness_seconds: int = 86_400,
+        jwks_snapshot_store: JwksSnapshotStore | None = None,
+        http_max_connections: int = 10,
+        jwks_min_forced_refresh_interval_seconds: int = 10,
+        unknown_key_id_cache_ttl_seconds: int = 60,
+        jwt_execution_mode: JwtExecutionMode = "inline",
+        jwt_executor_max_workers: int = 4,
+        jwt_executor_max_pending: int = 256,
+        http_client: httpx.AsyncClient | None = None,
+        token_cache_max_entries: int = 10_000,
+        token_cache_max_ttl_seconds: int = 300,
     ) -> None:
         self._issuer = issuer
         self._audience = audience.strip() if isinstance(audience, str) else None
@@ -30,17 +70,79 @@ class KeycloakTokenVerifier:
         self._oidc_config_url = oidc_config_url
         self._verify_ssl = verify_ssl
         self._jwks_cache_ttl_seconds = jwks_cache_ttl_seconds
+        self._jwks_refresh_interval_seconds = max(
+            jwks_cache_ttl_seconds - jwks_refresh_ahead_seconds,
+            jwks_cache_ttl_seconds / 2,
+        )
+        self._jwks_max_staleness_seconds = max(jwks_max_staleness_seconds, jwks_cache_ttl_seconds)
+        self._jwks_snapshot_store = jwks_snapshot_store
+        self._http_max_connections = http_max_connections
+        self._jwks_min_forced_refresh_interval_seconds = jwks_min_forced_refresh_interval_seconds
+        self._last_forced_refresh_at: float | None = None
+        self._unknown_key_ids = UnknownKeyIdCache(
+            max_entries=UNKNOWN_KEY_ID_CACHE_MAX_ENTRIES,
+            ttl_seconds=unknown_key_id_cache_ttl_seconds,
+        )
 
+        self._http_client = http_client
+        self._jwks_refresh_task: asyncio.Task[JwkKeyIndex] | None = None
+        self._refresh_ahead_task: asyncio.Task[None] | None = None
         self._oidc_config: dict[str, Any] | None = None
-        self._jwks: dict[str, Any] | None = None
+        self._key_index: JwkKeyIndex | None = None
         self._jwks_fetched_at: float = 0.0
+        self._decode_executor = JwtDecodeExecutor(
+            mode=jwt_execution_mode,
+            max_workers=jwt_executor_max_workers,
+            max_pending=jwt_executor_max_pending,
+            issuer=self._issuer,
+            audience=self._audience,
+        )
+        self._token_cache = VerifiedTokenCache(
+            max_entries=token_cache_max_entries,
+            max_ttl_seconds=token_cache_max_ttl_seconds,
+        )
+
+    def token_cache_stats(self) -> VerifiedTokenCacheStats:
+        return self._token_cache.stats()
+
+    async def start(self) -> None:
+        if self._refresh_ahead_task is not None:
+            return
+
+        if self._key_index is None:
+            await self._restore_snapshot()
+        if self._key_index is None:
+            # No usable snapshot: warm up before the worker accepts traffic.
+            with suppress(IdentityProviderUnavailableError):
+                await self._load_jwks(force_refresh=True)
+        self._refresh_ahead_task = asyncio.create_task(self._refresh_ahead_loop())
+
+    async def close(self) -> None:
+        tasks = (self._refresh_ahead_task, self._jwks_refresh_task)
+        self._refresh_ahead_task = None
+        self._jwks_refresh_task = None
+        for task in tasks:
+            if task is not None and not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self._decode_executor.close()
 
     async def verify_access_token(self, access_token: str) -> AuthenticatedPrincipal:
+        cached_principal = self._token_cache.get(access_token)
+        if cached_principal is not None:
+            return cached_principal
+
         try:
             header = jwt.get_unverified_header(access_token)
             key_id = header.get("kid")
-            claims = await self._decode_with_jwks(access_token, key_id)
-            print("Decoded JWT claims:", claims)  # Debug log for claims
+            algorithm = header.get("alg")
+            claims = await self._decode_with_jwks(access_token, key_id, algorithm)
+            logger.debug("Decoded JWT claims: %s", claims)
         except JWTError as error:
             raise UnauthorizedError("Invalid or expired access token.") from error
 
@@ -51,87 +153,145 @@ class KeycloakTokenVerifier:
         username_claim = claims.get("preferred_username")
         username = username_claim if isinstance(username_claim, str) else None
 
-        return AuthenticatedPrincipal(
+        principal = AuthenticatedPrincipal(
             subject=subject,
             username=username,
             groups=self._extract_groups(claims),
             roles=self._extract_roles(claims),
             active_claim=self._extract_active_claim(claims),
         )
+        self._token_cache.put(
+            access_token,
+            principal,
+            expires_at_epoch=self._extract_expiry(claims),
+        )
+        return principal
 
     async def _decode_with_jwks(
         self,
         access_token: str,
         key_id: str | None,
+        algorithm: str | None,
     ) -> dict[str, Any]:
-        jwks = await self._load_jwks(force_refresh=False)
-        claims = self._try_decode(access_token, key_id, jwks)
-        if claims is not None:
-            return claims
-
-        # Key rotation can happen, refresh JWKS once and retry.
-        jwks = await self._load_jwks(force_refresh=True)
-        claims = self._try_decode(access_token, key_id, jwks)
-        if claims is None:
-            raise JWTError("Unable to decode token with available JWKS keys.")
-        return claims
-
-    def _try_decode(
+        if algorithm != DEFAULT_SIGNING_ALGORITHM:
+            raise JWTError("Unsupported token signing algorithm.")
+
+        key_index = await self._load_jwks(force_refresh=False)
+        if key_index.find(key_id, algorithm) is None:
+            # Only an unknown kid can mean key rotation; bad signatures never refetch.
+            key_index = await self._load_rotated_key_index(key_id, algorithm)
+
+        return await self._decode_executor.decode(
+            access_token,
+            key_index,
+            key_id=key_id,
+            algorithm=algorithm,
+        )
+
+    async def _load_rotated_key_index(
         self,
-        access_token: str,
         key_id: str | None,
-        jwks: dict[str, Any],
-    ) -> dict[str, Any] | None:
-        keys = jwks.get("keys", [])
-        if not isinstance(keys, list):
-            return None
+        algorithm: str,
+    ) -> JwkKeyIndex:
+        negative_cache_key = key_id or ""
+        if negative_cache_key in self._unknown_key_ids or not self._forced_refresh_allowed():
+            raise JWTError("Token signing key is not in the Keycloak JWKS.")
 
-        candidates = [key for key in keys if isinstance(key, dict)]
-        if key_id:
-            candidates = [key for key in candidates if key.get("kid") == key_id]
+        self._last_forced_refresh_at = monotonic()
+        key_index = await self._load_jwks(force_refresh=True)
+        if key_index.find(key_id, algorithm) is None:
+            self._unknown_key_ids.add(negative_cache_key)
+            raise JWTError("Token signing key is not in the Keycloak JWKS.")
+        return key_index
 
-        verify_aud = self._audience is not None
-        for key in candidates:
-            try:
-                return jwt.decode(
-                    access_token,
-                    key,
-                    algorithms=["RS256"],
-                    issuer=self._issuer,
-                    audience=self._audience,
-                    options={"verify_aud": verify_aud},
-                )
-            except JWTError:
-                continue
-        return None
+    def _forced_refresh_allowed(self) -> bool:
+        refresh_task = self._jwks_refresh_task
+        if refresh_task is not None and not refresh_task.done():
+            # Joining an in-flight refresh costs no extra round trip.
+            return True
+        if self._last_forced_refresh_at is None:
+            return True
+        elapsed = monotonic() - self._last_forced_refresh_at
+        return elapsed >= self._jwks_min_forced_refresh_interval_seconds
 
     async def _load_oidc_config(self) -> dict[str, Any]:
         if self._oidc_config is not None:
             return self._oidc_config
 
         try:
-            async with httpx.AsyncClient(timeout=10.0, verify=self._verify_ssl) as client:
-                response = await client.get(self._oidc_config_url)
-                response.raise_for_status()
+            response = await self._get_http_client().get(self._oidc_config_url)
+            response.raise_for_status()
         except httpx.HTTPError as error:
             raise IdentityProviderUnavailableError(
                 "Cannot load Keycloak OIDC configuration."
             ) from error
 
-        payload = response.json()
-        if not isinstance(payload, dict):
-            raise IdentityProviderUnavailableError(
-                "Keycloak OIDC configuration payload is invalid."
-            )
-
+        payload = _json_object(response, "Keycloak OIDC configuration payload is invalid.")
         self._oidc_config = payload
         return payload
 
-    async def _load_jwks(self, force_refresh: bool) -> dict[str, Any]:
-        cache_is_valid = monotonic() - self._jwks_fetched_at < self._jwks_cache_ttl_seconds
-        if not force_refresh and self._jwks is not None and cache_is_valid:
-            return self._jwks
+    def _get_http_client(self) -> httpx.AsyncClient:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=IDP_HTTP_TIMEOUT_SECONDS,
+                verify=self._verify_ssl,
+                limits=httpx.Limits(
+                    max_connections=self._http_max_connections,
+                    max_keepalive_connections=self._http_max_connections,
+                ),
+            )
+        return self._http_client
+
+    async def _load_jwks(self, force_refresh: bool) -> JwkKeyIndex:
+        key_index = self._key_index
+        if key_index is not None and not force_refresh:
+            age = monotonic() - self._jwks_fetched_at
+            if age < self._jwks_cache_ttl_seconds:
+                return key_index
+            if age < self._jwks_max_staleness_seconds:
+                # Stale-while-revalidate: keep serving the previous key set.
+                self._schedule_jwks_refresh()
+                return key_index
+
+        # Waiters share one fetch; a cancelled request must not cancel it.
+        return await asyncio.shield(self._schedule_jwks_refresh())
+
+    def _schedule_jwks_refresh(self) -> asyncio.Task[JwkKeyIndex]:
+        task = self._jwks_refresh_task
+        if task is None or task.done():
+            task = asyncio.create_task(self._fetch_jwks())
+            task.add_done_callback(self._log_jwks_refresh_failure)
+            self._jwks_refresh_task = task
+        return task
+
+    @staticmethod
+    def _log_jwks_refresh_failure(task: asyncio.Task[JwkKeyIndex]) -> None:
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning("Keycloak JWKS refresh failed: %s", error)
 
+    async def _refresh_ahead_loop(self) -> None:
+        delay = 0.0
+        if self._key_index is not None:
+            age = monotonic() - self._jwks_fetched_at
+            delay = max(0.0, self._jwks_refresh_interval_seconds - age)
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await asyncio.shield(self._schedule_jwks_refresh())
+            except IdentityProviderUnavailableError:
+                delay = min(JWKS_REFRESH_RETRY_SECONDS, self._jwks_refresh_interval_seconds)
+                continue
+            except Exception:
+                # Anything unexpected must not end refresh-ahead for the worker's lifetime.
+                logger.exception("Unexpected error during Keycloak JWKS refresh-ahead.")
+                delay = min(JWKS_REFRESH_RETRY_SECONDS, self._jwks_refresh_interval_seconds)
+                continue
+            delay = self._jwks_refresh_interval_seconds
+
+    async def _fetch_jwks(self) -> JwkKeyIndex:
         oidc_config = await self._load_oidc_config()
         jwks_uri = oidc_config.get("jwks_uri")
         if not isinstance(jwks_uri, str) or not jwks_uri:
@@ -140,21 +300,70 @@ class KeycloakTokenVerifier:
             )
 
         try:
-            async with httpx.AsyncClient(timeout=10.0, verify=self._verify_ssl) as client:
-                response = await client.get(jwks_uri)
-                response.raise_for_status()
+            response = await self._get_http_client().get(jwks_uri)
+            response.raise_for_status()
         except httpx.HTTPError as error:
             raise IdentityProviderUnavailableError(
                 "Cannot load Keycloak JWKS keys."
             ) from error
 
-        payload = response.json()
-        if not isinstance(payload, dict):
-            raise IdentityProviderUnavailableError("Keycloak JWKS payload is invalid.")
+        payload = _json_object(response, "Keycloak JWKS payload is invalid.")
+        try:
+            key_index = JwkKeyIndex.from_jwks(payload)
+        except (ValueError, TypeError, KeyError) as error:
+            raise IdentityProviderUnavailableError("Keycloak JWKS payload is invalid.") from error
 
-        self._jwks = payload
+        self._key_index = key_index
         self._jwks_fetched_at = monotonic()
-        return payload
+        self._unknown_key_ids.clear()
+        await self._save_snapshot(oidc_config, payload)
+        return self._key_index
+
+    async def _restore_snapshot(self) -> None:
+        if self._jwks_snapshot_store is None:
+            return
+
+        snapshot = await asyncio.to_thread(self._jwks_snapshot_store.load)
+        if snapshot is None:
+            return
+        age = max(0.0, time() - snapshot.fetched_at)
+        if age >= self._jwks_max_staleness_seconds:
+            logger.warning("Ignoring JWKS snapshot older than the maximum staleness.")
+            return
+
+        try:
+            key_index = JwkKeyIndex.from_jwks(snapshot.jwks)
+        except (ValueError, TypeError, KeyError) as error:
+            logger.warning("Ignoring JWKS snapshot with an invalid key set: %s", error)
+            return
+        if not key_index.keys and not key_index.unnamed_keys:
+            logger.warning("Ignoring JWKS snapshot without usable signing keys.")
+            return
+
+        self._oidc_config = snapshot.oidc_config
+        self._key_index = key_index
+        self._jwks_fetched_at = monotonic() - age
+
+    async def _save_snapshot(
+        self,
+        oidc_config: dict[str, Any],
+        jwks: dict[str, Any],
+    ) -> None:
+        if self._jwks_snapshot_store is None:
+            return
+
+        snapshot = JwksSnapshot(oidc_config=oidc_config, jwks=jwks, fetched_at=time())
+        try:
+            await asyncio.to_thread(self._jwks_snapshot_store.save, snapshot)
+        except OSError as error:
+            logger.warning("Cannot write JWKS snapshot: %s", error)
+
+    @staticmethod
+    def _extract_expiry(claims: dict[str, Any]) -> float | None:
+        raw_exp = claims.get("exp")
+        if isinstance(raw_exp, bool) or not isinstance(raw_exp, (int, float)):
+            return None
+        return float(raw_exp)
 
     @staticmethod
     def _extract_groups(claims: dict[str, Any]) -> frozenset[str]:
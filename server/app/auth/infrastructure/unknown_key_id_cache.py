@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import monotonic
+
+
+class UnknownKeyIdCache:
+    """Bounded negative cache of key IDs that a fresh JWKS did not contain."""
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl_seconds = ttl_seconds
+        self._expires_at: OrderedDict[str, float] = OrderedDict()
+
+    def __contains__(self, key_id: str) -> bool:
+        expires_at = self._expires_at.get(key_id)
+        if expires_at is None:
+            return False
+        if monotonic() >= expires_at:
+            del self._expires_at[key_id]
+            return False
+        return True
+
+    def add(self, key_id: str) -> None:
+        self._expires_at[key_id] = monotonic() + self._ttl_seconds
+        self._expires_at.move_to_end(key_id)
+        while len(self._expires_at) > self._max_entries:
+            self._expires_at.popitem(last=False)
+
+    def clear(self) -> None:
+        self._expires_at.clear()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from hashlib import sha256
+from time import monotonic, time
+
+from app.auth.domain.principal import AuthenticatedPrincipal
+
+
+@dataclass(slots=True, frozen=True)
+class VerifiedTokenCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_entries: int
+
+
+class VerifiedTokenCache:
+    """LRU cache of verified principals keyed by a SHA-256 digest of the token."""
+
+    def __init__(self, *, max_entries: int, max_ttl_seconds: float) -> None:
+        self._max_entries = max(0, max_entries)
+        self._max_ttl_seconds = max_ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[AuthenticatedPrincipal, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    @staticmethod
+    def _key(access_token: str) -> bytes:
+        return sha256(access_token.encode("utf-8")).digest()
+
+    def get(self, access_token: str) -> AuthenticatedPrincipal | None:
+        if not self.enabled:
+            return None
+
+        key = self._key(access_token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        principal, expires_at = entry
+        if monotonic() >= expires_at:
+            del self._entries[key]
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return principal
+
+    def put(
+        self,
+        access_token: str,
+        principal: AuthenticatedPrincipal,
+        *,
+        expires_at_epoch: float | None,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        ttl_seconds = self._max_ttl_seconds
+        if expires_at_epoch is not None:
+            ttl_seconds = min(ttl_seconds, expires_at_epoch - time())
+        if ttl_seconds <= 0:
+            return
+
+        key = self._key(access_token)
+        self._entries[key] = (principal, monotonic() + ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> VerifiedTokenCacheStats:
+        return VerifiedTokenCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._entries),
+            max_entries=self._max_entries,
+        )
@@ -1,7 +1,10 @@
+from collections.abc import Awaitable, Callable
+
 from fastapi import Depends, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from app.auth.dependencies import get_auth_service
+from app.auth.domain.access_policy import AccessPolicyName
 from app.auth.domain.exceptions import (
     AuthError,
     UnauthorizedError,
@@ -30,12 +33,17 @@ async def get_current_principal(
         raise to_http_exception(error) from error
 
 
-async def get_current_authorized_principal(
-    current_principal: AuthenticatedPrincipal = Depends(get_current_principal),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> AuthenticatedPrincipal:
-    try:
-        auth_service.authorize_user(current_principal)
-    except AuthError as error:
-        raise to_http_exception(error) from error
-    return current_principal
+def require_access_policy(
+    policy_name: AccessPolicyName,
+) -> Callable[..., Awaitable[AuthenticatedPrincipal]]:
+    async def get_policy_authorized_principal(
+        current_principal: AuthenticatedPrincipal = Depends(get_current_principal),
+        auth_service: AuthService = Depends(get_auth_service),
+    ) -> AuthenticatedPrincipal:
+        try:
+            auth_service.authorize_user(current_principal, policy_name)
+        except AuthError as error:
+            raise to_http_exception(error) from error
+        return current_principal
+
+    return get_policy_authorized_principal
@@ -2,6 +2,7 @@ from fastapi import HTTPException, status
 
 from app.auth.domain.exceptions import (
     AuthError,
+    AuthOverloadedError,
     ForbiddenError,
     IdentityProviderUnavailableError,
 )
@@ -10,7 +11,7 @@ from app.auth.domain.exceptions import (
 def to_http_exception(error: AuthError) -> HTTPException:
     if isinstance(error, ForbiddenError):
         return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(error))
-    if isinstance(error, IdentityProviderUnavailableError):
+    if isinstance(error, (IdentityProviderUnavailableError, AuthOverloadedError)):
         return HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=str(error),
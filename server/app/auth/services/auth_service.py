@@ -1,4 +1,6 @@
-from app.auth.domain.access_policy import RoleAccessPolicy
+from collections.abc import Mapping
+
+from app.auth.domain.access_policy import AccessPolicy, AccessPolicyName
 from app.auth.domain.principal import AuthenticatedPrincipal
 from app.auth.domain.token_verifier import TokenVerifier
 
@@ -7,13 +9,25 @@ class AuthService:
     def __init__(
         self,
         token_verifier: TokenVerifier,
-        access_policy: RoleAccessPolicy,
+        access_policies: Mapping[AccessPolicyName, AccessPolicy],
     ) -> None:
         self._token_verifier = token_verifier
-        self._access_policy = access_policy
+        self._access_policies = dict(access_policies)
+        self._default_access_policy = self._access_policies["default"]
+
+    async def start(self) -> None:
+        await self._token_verifier.start()
+
+    async def close(self) -> None:
+        await self._token_verifier.close()
 
     async def authenticate(self, access_token: str) -> AuthenticatedPrincipal:
         return await self._token_verifier.verify_access_token(access_token)
 
-    def authorize_user(self, principal: AuthenticatedPrincipal) -> None:
-        self._access_policy.ensure_required_role(principal)
+    def authorize_user(
+        self,
+        principal: AuthenticatedPrincipal,
+        policy_name: AccessPolicyName = "default",
+    ) -> None:
+        access_policy = self._access_policies.get(policy_name, self._default_access_policy)
+        access_policy.ensure_allowed(principal)
@@ -0,0 +1 @@
+"""Browser control events and broker contracts."""
@@ -0,0 +1,18 @@
+from collections.abc import Callable
+from typing import Protocol
+
+from app.browser_control.domain.events import BrowserControlEvent
+
+EventHandler = Callable[[BrowserControlEvent], None]
+
+
+class BrowserControlEventBroker(Protocol):
+    async def start(self, handler: EventHandler) -> None:
+        """Begins calling `handler` on the event loop for every published event."""
+        ...
+
+    async def publish(self, event: BrowserControlEvent) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal
+
+BrowserControlAction = Literal["click", "popup", "close"]
+
+
+@dataclass(slots=True, frozen=True)
+class BrowserControlEvent:
+    event_id: str
+    owner_subject: str
+    action: BrowserControlAction
+    actor: str | None
+    created_at: datetime
@@ -0,0 +1 @@
+"""Browser control event broker adapters."""
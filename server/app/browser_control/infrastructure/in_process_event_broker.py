@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from app.browser_control.domain.brokers import EventHandler
+from app.browser_control.domain.events import BrowserControlEvent
+
+
+class InProcessEventBroker:
+    """Delivers events to this process only; the single-worker default."""
+
+    def __init__(self) -> None:
+        self._handler: EventHandler | None = None
+
+    async def start(self, handler: EventHandler) -> None:
+        self._handler = handler
+
+    async def publish(self, event: BrowserControlEvent) -> None:
+        if self._handler is None:
+            raise RuntimeError("Browser control event broker is not started.")
+        self._handler(event)
+
+    async def close(self) -> None:
+        self._handler = None
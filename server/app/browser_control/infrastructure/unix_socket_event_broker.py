@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import fcntl
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from app.browser_control.domain.brokers import EventHandler
+from app.browser_control.domain.events import BrowserControlEvent
+
+logger = logging.getLogger(__name__)
+
+STARTUP_TIMEOUT_SECONDS = 5.0
+# Sent by the hub once a peer is registered, so the peer knows relays will reach it.
+HUB_GREETING = b"\n"
+RECONNECT_INTERVAL_SECONDS = 0.5
+# Longest record line either side accepts; an event encodes to a few hundred bytes.
+MAX_RECORD_BYTES = 64 * 1024
+
+
+@dataclass(slots=True, frozen=True)
+class BrokerRelayStats:
+    # Own publishes not sent to the hub because it stopped reading.
+    dropped_to_hub: int
+    # Peers the hub cut off for not reading, or for an over-long line.
+    disconnected_peers: int
+    oversized_lines: int
+
+
+def _encode_event(event: BrowserControlEvent) -> bytes:
+    record = {
+        "event_id": event.event_id,
+        "owner_subject": event.owner_subject,
+        "action": event.action,
+        "actor": event.actor,
+        "created_at": event.created_at.isoformat(),
+    }
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _decode_event(line: bytes) -> BrowserControlEvent:
+    record = json.loads(line)
+    return BrowserControlEvent(
+        event_id=record["event_id"],
+        owner_subject=record["owner_subject"],
+        action=record["action"],
+        actor=record["actor"],
+        created_at=datetime.fromisoformat(record["created_at"]),
+    )
+
+
+class UnixSocketEventBroker:
+    """Fans events out to every worker process on one host through a Unix socket hub.
+
+    The worker holding the flock on `<socket>.lock` serves the hub and the
+    others connect to it. Each worker hands its own publishes to the local
+    handler and sends them to the hub, which relays them to every other
+    connection. When the hub worker exits the lock is released and the next
+    peer to reconnect takes over. Events published while a peer is
+    reconnecting reach only that peer's local subscribers.
+    """
+
+    def __init__(
+        self,
+        socket_path: str | Path,
+        *,
+        max_peer_buffer_bytes: int,
+    ) -> None:
+        self._socket_path = Path(socket_path)
+        self._lock_path = self._socket_path.with_name(f"{self._socket_path.name}.lock")
+        self._max_peer_buffer_bytes = max_peer_buffer_bytes
+        self._handler: EventHandler | None = None
+        self._lock_descriptor: int | None = None
+        self._server: asyncio.Server | None = None
+        self._peers: set[asyncio.StreamWriter] = set()
+        self._hub_writer: asyncio.StreamWriter | None = None
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._dropped_to_hub = 0
+        self._hub_overflowed = False
+        self._disconnected_peers = 0
+        self._oversized_lines = 0
+
+    @property
+    def is_hub(self) -> bool:
+        return self._server is not None
+
+    def stats(self) -> BrokerRelayStats:
+        return BrokerRelayStats(
+            dropped_to_hub=self._dropped_to_hub,
+            disconnected_peers=self._disconnected_peers,
+            oversized_lines=self._oversized_lines,
+        )
+
+    async def start(self, handler: EventHandler) -> None:
+        self._handler = handler
+        self._socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self._task = asyncio.create_task(self._run(), name="browser-control-broker")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=STARTUP_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning(
+                "Browser control broker hub at %s is not reachable yet; "
+                "events stay local until it is.",
+                self._socket_path,
+            )
+
+    async def publish(self, event: BrowserControlEvent) -> None:
+        if self._handler is None:
+            raise RuntimeError("Browser control event broker is not started.")
+        self._handler(event)
+
+        line = _encode_event(event)
+        if self._server is not None:
+            self._relay(line, source=None)
+        elif self._hub_writer is not None:
+            self._send_to_hub(self._hub_writer, line)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._handler = None
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                if self._try_lock():
+                    await self._serve_hub()
+                    return
+                try:
+                    reader, writer = await asyncio.open_unix_connection(
+                        self._socket_path,
+                        limit=MAX_RECORD_BYTES,
+                    )
+                except OSError:
+                    await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+                    continue
+                await self._follow_hub(reader, writer)
+                await asyncio.sleep(RECONNECT_INTERVAL_SECONDS)
+        finally:
+            self._ready.clear()
+            self._release()
+
+    def _try_lock(self) -> bool:
+        descriptor = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(descriptor)
+            return False
+        self._lock_descriptor = descriptor
+        return True
+
+    async def _serve_hub(self) -> None:
+        # Holding the lock means any existing socket file was left by a dead hub.
+        self._socket_path.unlink(missing_ok=True)
+        self._server = await asyncio.start_unix_server(
+            self._serve_peer,
+            self._socket_path,
+            limit=MAX_RECORD_BYTES,
+        )
+        logger.info("Serving browser control broker hub at %s.", self._socket_path)
+        self._ready.set()
+        await asyncio.Future()
+
+    async def _serve_peer(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._peers.add(writer)
+        writer.write(HUB_GREETING)
+        try:
+            while line := await reader.readline():
+                self._relay(line, source=writer)
+                self._deliver(line)
+        except ValueError:
+            # readline() raises ValueError past the stream limit; the framing is
+            # lost, so the peer is dropped and reconnects.
+            self._oversized_lines += 1
+            self._disconnected_peers += 1
+            logger.warning(
+                "Disconnecting browser control broker peer that sent a record over %d bytes.",
+                MAX_RECORD_BYTES,
+            )
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._peers.discard(writer)
+            writer.close()
+
+    async def _follow_hub(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            if await reader.readline() != HUB_GREETING:
+                return
+            self._hub_writer = writer
+            self._ready.set()
+            while line := await reader.readline():
+                self._deliver(line)
+        except ValueError:
+            self._oversized_lines += 1
+            logger.warning(
+                "Browser control broker hub sent a record over %d bytes.",
+                MAX_RECORD_BYTES,
+            )
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._hub_writer = None
+            writer.close()
+        logger.warning("Lost browser control broker hub at %s; reconnecting.", self._socket_path)
+
+    def _relay(self, line: bytes, *, source: asyncio.StreamWriter | None) -> None:
+        for peer in tuple(self._peers):
+            if peer is source:
+                continue
+            if peer.transport.get_write_buffer_size() > self._max_peer_buffer_bytes:
+                # Dropping a stuck worker keeps the hub's memory bounded; it reconnects.
+                logger.warning("Disconnecting browser control broker peer that stopped reading.")
+                self._disconnected_peers += 1
+                self._peers.discard(peer)
+                peer.transport.abort()
+                continue
+            peer.write(line)
+
+    def _send_to_hub(self, writer: asyncio.StreamWriter, line: bytes) -> None:
+        # publish() does not wait for the hub: a stalled hub would otherwise hold
+        # every request that publishes. Past the buffer limit the event stays
+        # local, like a full subscriber queue drops events.
+        if writer.transport.get_write_buffer_size() > self._max_peer_buffer_bytes:
+            self._dropped_to_hub += 1
+            if not self._hub_overflowed:
+                self._hub_overflowed = True
+                logger.warning(
+                    "Browser control broker hub at %s stopped reading; "
+                    "events stay local until it catches up.",
+                    self._socket_path,
+                )
+            return
+        self._hub_overflowed = False
+        writer.write(line)
+
+    def _deliver(self, line: bytes) -> None:
+        if self._handler is None:
+            return
+        try:
+            event = _decode_event(line)
+        except (ValueError, KeyError, TypeError) as error:
+            logger.warning("Skipping malformed browser control broker record: %s", error)
+            return
+        self._handler(event)
+
+    def _release(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            self._socket_path.unlink(missing_ok=True)
+        for peer in tuple(self._peers):
+            peer.transport.abort()
+        self._peers.clear()
+        if self._hub_writer is not None:
+            self._hub_writer.close()
+            self._hub_writer = None
+        if self._lock_descriptor is not None:
+            os.close(self._lock_descriptor)
+            self._lock_descriptor = None
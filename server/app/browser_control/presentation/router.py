@@ -1,73 +1,99 @@
 from __future__ import annotations
 
-import asyncio
 import json
 from datetime import datetime, UTC
 from typing import Annotated, AsyncGenerator
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from fastapi.responses import StreamingResponse
 
 from app.auth.domain.principal import AuthenticatedPrincipal
-from app.auth.presentation.dependencies import get_current_authorized_principal
+from app.auth.presentation.dependencies import require_access_policy
 from app.browser_control.presentation.schemas import (
     BrowserControlActionRequest,
     BrowserControlActionResponse,
-    BrowserControlEventResponse,
 )
-from app.browser_control.services.browser_control_event_service import BrowserControlEventService
-from app.core.dependencies import get_browser_control_event_service
+from app.browser_control.presentation.sse import (
+    KEEPALIVE_FRAME,
+    SLOW_CONSUMER_FRAME,
+    SSE_MEDIA_TYPE,
+    EventFrameCache,
+    sse_frame,
+)
+from app.browser_control.services.browser_control_event_service import (
+    BrowserControlEventService,
+    StreamSignal,
+)
+from app.core.dependencies import (
+    get_browser_control_event_service,
+    get_browser_control_frame_cache,
+)
 
 router = APIRouter(prefix="/browser-control", tags=["browser-control"])
 
 CurrentPrincipal = Annotated[
     AuthenticatedPrincipal,
-    Depends(get_current_authorized_principal),
+    Depends(require_access_policy("browser_control")),
 ]
 BrowserControlEventServiceDep = Annotated[
     BrowserControlEventService,
     Depends(get_browser_control_event_service),
 ]
+EventFrameCacheDep = Annotated[EventFrameCache, Depends(get_browser_control_frame_cache)]
 
-SSE_KEEPALIVE_SECONDS = 20.0
-
-
-def _to_sse_line(*, event: str, data: str) -> str:
-    return f"event: {event}\ndata: {data}\n\n"
+LAST_EVENT_ID_MAX_LENGTH = 64
 
 
 @router.get("/events")
 async def stream_browser_control_events(
     current_principal: CurrentPrincipal,
     event_service: BrowserControlEventServiceDep,
+    frame_cache: EventFrameCacheDep,
+    last_event_id: Annotated[
+        str | None,
+        Header(alias="Last-Event-ID", max_length=LAST_EVENT_ID_MAX_LENGTH),
+    ] = None,
 ) -> StreamingResponse:
-    queue = await event_service.subscribe(current_principal.subject)
+    queue, replay = await event_service.subscribe(
+        current_principal.subject,
+        last_event_id=last_event_id,
+    )
 
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         connected_payload = json.dumps(
             {"connected_at": datetime.now(UTC).isoformat()}
-        )
-        yield _to_sse_line(event="connected", data=connected_payload)
+        ).encode("ascii")
+        yield sse_frame(event="connected", data=connected_payload)
 
         try:
+            if not replay.complete:
+                # The client's last event is gone from the buffer, so it may have missed some.
+                yield sse_frame(
+                    event="replay-gap",
+                    data=json.dumps({"last_event_id": last_event_id}).encode("utf-8"),
+                )
+            for event in replay.events:
+                yield frame_cache.frame(event)
+
             while True:
-                try:
-                    event = await asyncio.wait_for(
-                        queue.get(),
-                        timeout=SSE_KEEPALIVE_SECONDS,
-                    )
-                except asyncio.TimeoutError:
-                    yield ": keepalive\n\n"
+                item = await queue.get()
+                if item is StreamSignal.KEEPALIVE:
+                    yield KEEPALIVE_FRAME
                     continue
-
-                payload = BrowserControlEventResponse.from_domain(event).model_dump_json()
-                yield _to_sse_line(event="control-action", data=payload)
+                if item is StreamSignal.DISCONNECT:
+                    # Dropped by the disconnect backpressure policy; the client
+                    # reconnects with Last-Event-ID and gets the backlog replayed.
+                    yield SLOW_CONSUMER_FRAME
+                    return
+
+                # Encoded by the first stream that sees the event, then shared.
+                yield frame_cache.frame(item)
         finally:
             await event_service.unsubscribe(current_principal.subject, queue)
 
     return StreamingResponse(
         event_generator(),
-        media_type="text/event-stream",
+        media_type=SSE_MEDIA_TYPE,
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
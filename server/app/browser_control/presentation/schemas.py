@@ -1,11 +1,8 @@
 from datetime import datetime
-from typing import Literal
 
 from pydantic import BaseModel
 
-from app.browser_control.services.browser_control_event_service import BrowserControlEvent
-
-BrowserControlAction = Literal["click", "popup", "close"]
+from app.browser_control.domain.events import BrowserControlAction, BrowserControlEvent
 
 
 class BrowserControlActionRequest(BaseModel):
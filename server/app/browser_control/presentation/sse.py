@@ -0,0 +1,40 @@
+from collections import OrderedDict
+
+from app.browser_control.domain.events import BrowserControlEvent
+from app.browser_control.presentation.schemas import BrowserControlEventResponse
+
+SSE_MEDIA_TYPE = "text/event-stream"
+KEEPALIVE_FRAME = b": keepalive\n\n"
+SLOW_CONSUMER_FRAME = b'event: disconnect\ndata: {"reason":"slow_consumer"}\n\n'
+# Every stream of an owner writes a new event within moments of the others, so
+# a window of recent events is enough to encode each one once.
+EVENT_FRAME_CACHE_MAX_ENTRIES = 4096
+
+
+def sse_frame(*, event: str, data: bytes, event_id: str | None = None) -> bytes:
+    # Only frames with an id move the client's Last-Event-ID.
+    id_line = b"id: " + event_id.encode("ascii") + b"\n" if event_id is not None else b""
+    return b"".join((id_line, b"event: ", event.encode("ascii"), b"\ndata: ", data, b"\n\n"))
+
+
+class EventFrameCache:
+    """`control-action` frames of recent events keyed by event id, shared by every stream.
+
+    Only touched from the event loop, so no lock is needed.
+    """
+
+    def __init__(self, *, max_entries: int = EVENT_FRAME_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._frames: OrderedDict[str, bytes] = OrderedDict()
+
+    def frame(self, event: BrowserControlEvent) -> bytes:
+        encoded = self._frames.get(event.event_id)
+        if encoded is not None:
+            return encoded
+
+        payload = BrowserControlEventResponse.from_domain(event).model_dump_json().encode("utf-8")
+        encoded = sse_frame(event="control-action", data=payload, event_id=event.event_id)
+        self._frames[event.event_id] = encoded
+        if len(self._frames) > self._max_entries:
+            self._frames.popitem(last=False)
+        return encoded
@@ -1,47 +1,156 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
+import contextlib
+import logging
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, UTC
+from enum import Enum
 from typing import Literal
 from uuid import uuid4
 
-BrowserControlAction = Literal["click", "popup", "close"]
-EventQueue = asyncio.Queue["BrowserControlEvent"]
+from app.browser_control.domain.brokers import BrowserControlEventBroker
+from app.browser_control.domain.events import BrowserControlAction, BrowserControlEvent
+from app.browser_control.services.event_replay_buffer import (
+    EventReplay,
+    EventReplayBuffer,
+    EventReplayStats,
+)
 
-EVENT_QUEUE_MAX_SIZE = 100
+logger = logging.getLogger(__name__)
+
+BackpressurePolicy = Literal["drop_oldest", "drop_newest", "coalesce", "disconnect"]
+
+# Keepalives queued between yields to the loop, so one tick cannot stall requests.
+KEEPALIVE_BATCH_SIZE = 1000
+QUEUE_STATS_MAX_SUBJECTS = 10_000
+
+
+class StreamSignal(Enum):
+    KEEPALIVE = "keepalive"
+    # The stream fell too far behind and must end; the client resumes with Last-Event-ID.
+    DISCONNECT = "disconnect"
+
+
+QueueItem = BrowserControlEvent | StreamSignal
+
+
+class EventQueue(asyncio.Queue[QueueItem]):
+    """One stream's bounded queue; remembers its newest item for coalescing."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize)
+        self.newest: QueueItem | None = None
+        self.overflowed = False
+
+    def put_nowait(self, item: QueueItem) -> None:
+        super().put_nowait(item)
+        self.newest = item
 
 
 @dataclass(slots=True, frozen=True)
-class BrowserControlEvent:
-    event_id: str
-    owner_subject: str
-    action: BrowserControlAction
-    actor: str | None
-    created_at: datetime
+class SubscriberQueueStats:
+    dropped: int
+    coalesced: int
+    disconnected: int
+    # Deepest any of the subject's queues has been.
+    high_water_mark: int
 
 
-class BrowserControlEventService:
+class _QueueStatsRecorder:
+    __slots__ = ("dropped", "coalesced", "disconnected", "high_water_mark")
+
     def __init__(self) -> None:
-        self._subscribers: dict[str, set[EventQueue]] = defaultdict(set)
-        self._lock = asyncio.Lock()
+        self.dropped = 0
+        self.coalesced = 0
+        self.disconnected = 0
+        self.high_water_mark = 0
+
+    def snapshot(self) -> SubscriberQueueStats:
+        return SubscriberQueueStats(
+            dropped=self.dropped,
+            coalesced=self.coalesced,
+            disconnected=self.disconnected,
+            high_water_mark=self.high_water_mark,
+        )
+
+
+def _is_repeat(queued: QueueItem | None, event: BrowserControlEvent) -> bool:
+    return (
+        isinstance(queued, BrowserControlEvent)
+        and queued.action == event.action
+        and queued.actor == event.actor
+    )
+
+
+class BrowserControlEventService:
+    def __init__(
+        self,
+        *,
+        broker: BrowserControlEventBroker,
+        replay_buffer: EventReplayBuffer,
+        keepalive_interval_seconds: float,
+        queue_max_size: int,
+        backpressure_policy: BackpressurePolicy,
+    ) -> None:
+        self._broker = broker
+        self._replay_buffer = replay_buffer
+        self._keepalive_interval_seconds = keepalive_interval_seconds
+        self._keepalive_task: asyncio.Task[None] | None = None
+        self._queue_max_size = queue_max_size
+        self._backpressure_policy = backpressure_policy
+        # Only touched from the event loop, so no lock is needed; the broker
+        # also calls `_deliver` from the loop.
+        self._subscribers: dict[str, set[EventQueue]] = {}
+        self._queue_stats: OrderedDict[str, _QueueStatsRecorder] = OrderedDict()
+
+    async def start(self) -> None:
+        await self._broker.start(self._deliver)
+        self._keepalive_task = asyncio.create_task(
+            self._send_keepalives(),
+            name="browser-control-keepalive",
+        )
+
+    async def close(self) -> None:
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._keepalive_task
+            self._keepalive_task = None
+        await self._broker.close()
+
+    async def subscribe(
+        self,
+        owner_subject: str,
+        *,
+        last_event_id: str | None = None,
+    ) -> tuple[EventQueue, EventReplay]:
+        """Registers a queue for live events plus the buffered events after `last_event_id`.
 
-    async def subscribe(self, owner_subject: str) -> EventQueue:
-        queue: EventQueue = asyncio.Queue(maxsize=EVENT_QUEUE_MAX_SIZE)
-        async with self._lock:
-            self._subscribers[owner_subject].add(queue)
-        return queue
+        Both happen without yielding to the loop, so no event is missed or
+        delivered twice between the replay and the live queue.
+        """
+        queue = EventQueue(maxsize=self._queue_max_size)
+        self._subscribers.setdefault(owner_subject, set()).add(queue)
+        if last_event_id is None:
+            return queue, EventReplay(events=[], complete=True)
+        return queue, self._replay_buffer.since(owner_subject, last_event_id)
 
     async def unsubscribe(self, owner_subject: str, queue: EventQueue) -> None:
-        async with self._lock:
-            subscribers = self._subscribers.get(owner_subject)
-            if not subscribers:
-                return
+        subscribers = self._subscribers.get(owner_subject)
+        if not subscribers:
+            return
 
-            subscribers.discard(queue)
-            if not subscribers:
-                self._subscribers.pop(owner_subject, None)
+        subscribers.discard(queue)
+        if not subscribers:
+            self._subscribers.pop(owner_subject, None)
+
+    def replay_stats(self) -> EventReplayStats:
+        return self._replay_buffer.stats()
+
+    def queue_stats(self) -> dict[str, SubscriberQueueStats]:
+        return {subject: recorder.snapshot() for subject, recorder in self._queue_stats.items()}
 
     async def publish_action(
         self,
@@ -57,17 +166,98 @@ class BrowserControlEventService:
             actor=actor,
             created_at=datetime.now(UTC),
         )
+        await self._broker.publish(event)
+        return event
 
-        async with self._lock:
-            targets = tuple(self._subscribers.get(owner_subject, set()))
+    def _deliver(self, event: BrowserControlEvent) -> None:
+        self._replay_buffer.append(event)
+        subscribers = self._subscribers.get(event.owner_subject)
+        if not subscribers:
+            return
 
-        for queue in targets:
-            if queue.full():
-                try:
-                    queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-            queue.put_nowait(event)
+        stats = self._stats_for(event.owner_subject)
+        for queue in tuple(subscribers):
+            self._enqueue(queue, event, stats)
 
-        return event
+    def _enqueue(
+        self,
+        queue: EventQueue,
+        event: BrowserControlEvent,
+        stats: _QueueStatsRecorder,
+    ) -> None:
+        policy = self._backpressure_policy
+        if policy == "coalesce" and not queue.empty() and _is_repeat(queue.newest, event):
+            # The stream has not caught up with the identical action queued before.
+            stats.coalesced += 1
+            return
+
+        if queue.full():
+            if not queue.overflowed:
+                queue.overflowed = True
+                logger.warning(
+                    "Browser control stream for %s is full (%d events); applying %s.",
+                    event.owner_subject,
+                    queue.qsize(),
+                    policy,
+                )
+            if policy == "drop_newest":
+                stats.dropped += 1
+                return
+            if policy == "disconnect":
+                self._disconnect(event.owner_subject, queue, stats)
+                stats.dropped += 1
+                return
+            # drop_oldest, and coalesce once the tail differs.
+            if isinstance(queue.get_nowait(), BrowserControlEvent):
+                stats.dropped += 1
+
+        queue.put_nowait(event)
+        depth = queue.qsize()
+        if depth > stats.high_water_mark:
+            stats.high_water_mark = depth
+
+    def _disconnect(
+        self,
+        owner_subject: str,
+        queue: EventQueue,
+        stats: _QueueStatsRecorder,
+    ) -> None:
+        while not queue.empty():
+            if isinstance(queue.get_nowait(), BrowserControlEvent):
+                stats.dropped += 1
+        queue.put_nowait(StreamSignal.DISCONNECT)
+        stats.disconnected += 1
+        subscribers = self._subscribers.get(owner_subject)
+        if subscribers is not None:
+            subscribers.discard(queue)
+            if not subscribers:
+                self._subscribers.pop(owner_subject, None)
+
+    def _stats_for(self, owner_subject: str) -> _QueueStatsRecorder:
+        recorder = self._queue_stats.get(owner_subject)
+        if recorder is None:
+            recorder = _QueueStatsRecorder()
+            self._queue_stats[owner_subject] = recorder
+            if len(self._queue_stats) > QUEUE_STATS_MAX_SUBJECTS:
+                self._queue_stats.popitem(last=False)
+        else:
+            self._queue_stats.move_to_end(owner_subject)
+        return recorder
+
+    async def _send_keepalives(self) -> None:
+        """One ticker for every stream instead of a timeout per stream.
 
+        Each tick queues a keepalive for streams with nothing pending; a
+        stream that is still writing events does not need one.
+        """
+        while True:
+            await asyncio.sleep(self._keepalive_interval_seconds)
+            queued = 0
+            for subscribers in tuple(self._subscribers.values()):
+                for queue in tuple(subscribers):
+                    if not queue.empty():
+                        continue
+                    queue.put_nowait(StreamSignal.KEEPALIVE)
+                    queued += 1
+                    if queued % KEEPALIVE_BATCH_SIZE == 0:
+                        await asyncio.sleep(0)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+
+from app.browser_control.domain.events import BrowserControlEvent
+
+
+@dataclass(slots=True, frozen=True)
+class EventReplay:
+    events: list[BrowserControlEvent]
+    # False when the requested event is no longer buffered (evicted, expired or
+    # unknown), so some events between it and `events` may have been missed.
+    complete: bool
+
+
+@dataclass(slots=True, frozen=True)
+class EventReplayStats:
+    owners: int
+    buffered_events: int
+    # Pushed out of a full per-owner ring.
+    evicted_overflow: int
+    # Pushed out of the least recently published owner to stay under max_events.
+    evicted_capacity: int
+    expired: int
+    replayed: int
+    incomplete_replays: int
+
+
+class EventReplayBuffer:
+    """Recent events per owner for `Last-Event-ID` resume, bounded in count and age.
+
+    Each owner keeps a ring of at most `events_per_owner` events. When the
+    total across owners exceeds `max_events`, the owners that published least
+    recently lose their oldest events first.
+    """
+
+    def __init__(
+        self,
+        *,
+        events_per_owner: int,
+        max_events: int,
+        max_age_seconds: float,
+    ) -> None:
+        self._events_per_owner = events_per_owner
+        self._max_events = max_events
+        self._max_age = timedelta(seconds=max_age_seconds)
+        self._buffers: OrderedDict[str, deque[BrowserControlEvent]] = OrderedDict()
+        self._buffered_events = 0
+        self._evicted_overflow = 0
+        self._evicted_capacity = 0
+        self._expired = 0
+        self._replayed = 0
+        self._incomplete_replays = 0
+
+    def append(self, event: BrowserControlEvent) -> None:
+        if self._events_per_owner == 0 or self._max_events == 0:
+            return
+
+        buffer = self._buffers.get(event.owner_subject)
+        if buffer is None:
+            buffer = deque(maxlen=self._events_per_owner)
+            self._buffers[event.owner_subject] = buffer
+        else:
+            self._buffers.move_to_end(event.owner_subject)
+
+        if len(buffer) == self._events_per_owner:
+            self._evicted_overflow += 1
+            self._buffered_events -= 1
+        buffer.append(event)
+        self._buffered_events += 1
+
+        while self._buffered_events > self._max_events:
+            owner_subject, oldest = next(iter(self._buffers.items()))
+            oldest.popleft()
+            self._buffered_events -= 1
+            self._evicted_capacity += 1
+            if not oldest:
+                del self._buffers[owner_subject]
+
+    def since(self, owner_subject: str, last_event_id: str) -> EventReplay:
+        buffer = self._buffers.get(owner_subject)
+        if buffer is None:
+            self._incomplete_replays += 1
+            return EventReplay(events=[], complete=False)
+
+        self._expire(owner_subject, buffer)
+        events = list(buffer)
+        for index in range(len(events) - 1, -1, -1):
+            if events[index].event_id == last_event_id:
+                missed = events[index + 1:]
+                self._replayed += len(missed)
+                return EventReplay(events=missed, complete=True)
+
+        self._replayed += len(events)
+        self._incomplete_replays += 1
+        return EventReplay(events=events, complete=False)
+
+    def stats(self) -> EventReplayStats:
+        return EventReplayStats(
+            owners=len(self._buffers),
+            buffered_events=self._buffered_events,
+            evicted_overflow=self._evicted_overflow,
+            evicted_capacity=self._evicted_capacity,
+            expired=self._expired,
+            replayed=self._replayed,
+            incomplete_replays=self._incomplete_replays,
+        )
+
+    def _expire(self, owner_subject: str, buffer: deque[BrowserControlEvent]) -> None:
+        cutoff = datetime.now(UTC) - self._max_age
+        while buffer and buffer[0].created_at < cutoff:
+            buffer.popleft()
+            self._buffered_events -= 1
+            self._expired += 1
+        if not buffer:
+            del self._buffers[owner_subject]
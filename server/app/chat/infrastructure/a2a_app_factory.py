@@ -1,27 +1,13 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI
 
 from app.auth.dependencies import get_auth_service
-from app.auth.domain.exceptions import AuthError, UnauthorizedError
-from app.auth.presentation.http_errors import to_http_exception
+from app.chat.infrastructure.a2a_auth_middleware import A2AAuthMiddleware, A2ASessionBindings
 from app.chat.infrastructure.langchain_chat_handler import LangChainOllamaTaskHandler
 from app.core.settings import Settings
 
 
-def _extract_bearer_token(request: Request) -> str:
-    authorization = request.headers.get("authorization")
-    if not authorization:
-        raise UnauthorizedError("Authorization bearer token is required.")
-
-    scheme, _, token = authorization.partition(" ")
-    if scheme.lower() != "bearer" or not token:
-        raise UnauthorizedError("Authorization bearer token is required.")
-
-    return token
-
-
 def create_chat_a2a_app(settings: Settings) -> FastAPI:
     from a2a_server import create_app as create_a2a_server_app
 
@@ -65,25 +51,10 @@ def create_chat_a2a_app(settings: Settings) -> FastAPI:
         config={"cors": {"enabled": False}},
     )
 
-    auth_service = get_auth_service()
-
-    @a2a_app.middleware("http")
-    async def require_authenticated_user(request: Request, call_next):
-        if request.method == "OPTIONS":
-            return await call_next(request)
-
-        try:
-            token = _extract_bearer_token(request)
-            principal = await auth_service.authenticate(token)
-            auth_service.authorize_user(principal)
-            request.state.principal = principal
-        except AuthError as error:
-            http_error = to_http_exception(error)
-            return JSONResponse(
-                status_code=http_error.status_code,
-                content={"detail": http_error.detail},
-            )
-
-        return await call_next(request)
+    a2a_app.add_middleware(
+        A2AAuthMiddleware,
+        auth_service=get_auth_service(),
+        session_bindings=A2ASessionBindings(),
+    )
 
     return a2a_app
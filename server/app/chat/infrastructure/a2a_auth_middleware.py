@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import json
+import re
+from collections import OrderedDict
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.auth.domain.exceptions import AuthError, ForbiddenError, UnauthorizedError
+from app.auth.presentation.http_errors import to_http_exception
+from app.auth.services.auth_service import AuthService
+
+SESSION_BINDINGS_MAX_ENTRIES = 50_000
+RPC_BODY_INSPECT_MAX_BYTES = 64 * 1024
+# JSON-RPC methods that create a task/session or act on one in a way that must
+# stay with its owner. Read-only polling (tasks/get) relies on the task ID being
+# unguessable and is streamed through without parsing.
+ID_BINDING_METHODS = frozenset(
+    {
+        "tasks/send",
+        "tasks/sendSubscribe",
+        "tasks/cancel",
+        "tasks/resubscribe",
+        "tasks/pushNotification/set",
+    }
+)
+_RPC_METHOD_PATTERN = re.compile(rb'"method"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _extract_bearer_token(scope: Scope) -> str:
+    authorization = None
+    for name, value in scope.get("headers", ()):
+        if name == b"authorization":
+            authorization = value.decode("latin-1")
+            break
+    if not authorization:
+        raise UnauthorizedError("Authorization bearer token is required.")
+
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise UnauthorizedError("Authorization bearer token is required.")
+
+    return token
+
+
+class _RequestBodyTooLargeError(Exception):
+    pass
+
+
+def _may_bind_ids(body: bytes) -> bool:
+    """Cheap scan of a complete body; True unless every RPC method found is read-only.
+
+    Without any backslash every JSON string is spelled literally, so each
+    "method" key (including one nested as a decoy) is found by the pattern.
+    Escapes could hide a key or its value, so such bodies are always parsed.
+    """
+    if b"\\" in body:
+        return True
+    methods = _RPC_METHOD_PATTERN.findall(body)
+    if not methods:
+        return True
+    return any(method.decode("utf-8", "replace") in ID_BINDING_METHODS for method in methods)
+
+
+def _extract_session_keys(body: bytes) -> list[str]:
+    if not body:
+        return []
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return []
+
+    keys: list[str] = []
+    for rpc_call in payload if isinstance(payload, list) else [payload]:
+        if not isinstance(rpc_call, dict) or rpc_call.get("method") not in ID_BINDING_METHODS:
+            continue
+        params = rpc_call.get("params")
+        if not isinstance(params, dict):
+            continue
+        task_id = params.get("id")
+        if isinstance(task_id, str) and task_id:
+            keys.append(f"task:{task_id}")
+        session_id = params.get("sessionId")
+        if isinstance(session_id, str) and session_id:
+            keys.append(f"session:{session_id}")
+    return keys
+
+
+class A2ASessionBindings:
+    """Binds A2A task and session IDs to the subject that first used them."""
+
+    def __init__(self, *, max_entries: int = SESSION_BINDINGS_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._owners: OrderedDict[str, str] = OrderedDict()
+
+    def bind(self, subject: str, keys: list[str]) -> None:
+        for key in keys:
+            owner = self._owners.get(key)
+            if owner is not None and owner != subject:
+                raise ForbiddenError("A2A session belongs to another user.")
+
+        for key in keys:
+            self._owners[key] = subject
+            self._owners.move_to_end(key)
+        while len(self._owners) > self._max_entries:
+            self._owners.popitem(last=False)
+
+
+class A2AAuthMiddleware:
+    """Plain ASGI auth for the mounted A2A app.
+
+    Principals come from the app-wide AuthService, so polling with the same
+    access token hits its verified-token cache and memoized policy decision
+    instead of re-running RS256 verification.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        auth_service: AuthService,
+        session_bindings: A2ASessionBindings,
+    ) -> None:
+        self._app = app
+        self._auth_service = auth_service
+        self._session_bindings = session_bindings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self._app(scope, receive, send)
+            return
+
+        try:
+            token = _extract_bearer_token(scope)
+            principal = await self._auth_service.authenticate(token)
+            self._auth_service.authorize_user(principal, "chat")
+            if scope["method"] == "POST":
+                receive = await self._bind_session_ids(principal.subject, receive)
+        except AuthError as error:
+            http_error = to_http_exception(error)
+            response = JSONResponse(
+                status_code=http_error.status_code,
+                content={"detail": http_error.detail},
+            )
+            await response(scope, receive, send)
+            return
+        except _RequestBodyTooLargeError:
+            response = JSONResponse(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                content={"detail": "A2A request body is too large."},
+            )
+            await response(scope, receive, send)
+            return
+
+        scope.setdefault("state", {})["principal"] = principal
+        await self._app(scope, receive, send)
+
+    async def _bind_session_ids(self, subject: str, receive: Receive) -> Receive:
+        first = await receive()
+        if first["type"] != "http.request":
+            return self._replay_messages([first], receive)
+
+        # A body that arrived in one message is only parsed when it may bind IDs;
+        # polling passes through untouched. Chunked bodies are always parsed, since
+        # the top-level method may not be in the first chunk.
+        if not first.get("more_body", False) and not _may_bind_ids(first.get("body", b"")):
+            return self._replay_messages([first], receive)
+
+        # Bodies that must be parsed are buffered up to a fixed size; a larger one
+        # is rejected rather than let through unchecked.
+        messages = [first]
+        size = len(first.get("body", b""))
+        while size <= RPC_BODY_INSPECT_MAX_BYTES and messages[-1].get("more_body", False):
+            message = await receive()
+            messages.append(message)
+            if message["type"] != "http.request":
+                break
+            size += len(message.get("body", b""))
+        if size > RPC_BODY_INSPECT_MAX_BYTES:
+            raise _RequestBodyTooLargeError
+        body = b"".join(
+            message.get("body", b"") for message in messages if message["type"] == "http.request"
+        )
+        self._session_bindings.bind(subject, _extract_session_keys(body))
+        return self._replay_messages(messages, receive)
+
+    @staticmethod
+    def _replay_messages(messages: list[Message], receive: Receive) -> Receive:
+        pending = list(messages)
+
+        async def replay_receive() -> Message:
+            if pending:
+                return pending.pop(0)
+            # Streaming responses keep listening for the client disconnect.
+            return await receive()
+
+        return replay_receive
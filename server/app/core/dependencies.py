@@ -1,8 +1,21 @@
 from functools import lru_cache
 
+from app.browser_control.domain.brokers import BrowserControlEventBroker
+from app.browser_control.infrastructure.in_process_event_broker import InProcessEventBroker
+from app.browser_control.infrastructure.unix_socket_event_broker import UnixSocketEventBroker
+from app.browser_control.presentation.sse import EventFrameCache
 from app.browser_control.services.browser_control_event_service import BrowserControlEventService
+from app.browser_control.services.event_replay_buffer import EventReplayBuffer
 from app.core.settings import Settings
+from app.projects.domain.repositories import ProjectRepository
 from app.projects.infrastructure.in_memory_project_repository import InMemoryProjectRepository
+from app.projects.infrastructure.offloading_project_repository import (
+    OffloadingProjectRepository,
+)
+from app.projects.infrastructure.project_journal import ProjectJournal
+from app.projects.infrastructure.sqlite_project_repository import SqliteProjectRepository
+from app.projects.presentation.idempotency import IdempotencyCache
+from app.projects.presentation.serialization import ProjectJsonCache
 from app.projects.services.project_service import ProjectService
 
 
@@ -12,15 +25,81 @@ def get_settings() -> Settings:
 
 
 @lru_cache
-def get_project_repository() -> InMemoryProjectRepository:
+def get_project_repository() -> ProjectRepository:
+    settings = get_settings()
+    if settings.project_repository_backend == "sqlite":
+        return SqliteProjectRepository(
+            settings.project_sqlite_path,
+            pool_size=settings.project_sqlite_pool_size,
+        )
+    if settings.project_repository_backend == "journal":
+        return InMemoryProjectRepository(
+            journal=ProjectJournal(
+                settings.project_journal_dir,
+                fsync_interval_seconds=settings.project_journal_fsync_interval_ms / 1000,
+                compact_interval_seconds=settings.project_journal_compact_interval_seconds,
+                compact_min_records=settings.project_journal_compact_min_records,
+            )
+        )
     return InMemoryProjectRepository()
 
 
+@lru_cache
+def get_async_project_repository() -> OffloadingProjectRepository:
+    settings = get_settings()
+    return OffloadingProjectRepository(
+        get_project_repository(),
+        max_workers=settings.project_repository_max_workers,
+        slow_call_seconds=settings.project_repository_slow_call_ms / 1000,
+    )
+
+
 @lru_cache
 def get_project_service() -> ProjectService:
-    return ProjectService(repository=get_project_repository())
+    return ProjectService(repository=get_async_project_repository())
+
+
+@lru_cache
+def get_idempotency_cache() -> IdempotencyCache:
+    settings = get_settings()
+    return IdempotencyCache(
+        max_entries=settings.project_idempotency_max_entries,
+        ttl_seconds=settings.project_idempotency_ttl_seconds,
+    )
+
+
+@lru_cache
+def get_project_json_cache() -> ProjectJsonCache:
+    return ProjectJsonCache(max_entries=get_settings().project_json_cache_max_entries)
+
+
+@lru_cache
+def get_browser_control_event_broker() -> BrowserControlEventBroker:
+    settings = get_settings()
+    if settings.browser_control_broker_backend == "unix_socket":
+        return UnixSocketEventBroker(
+            settings.browser_control_broker_socket_path,
+            max_peer_buffer_bytes=settings.browser_control_broker_max_peer_buffer_bytes,
+        )
+    return InProcessEventBroker()
+
+
+@lru_cache
+def get_browser_control_frame_cache() -> EventFrameCache:
+    return EventFrameCache()
 
 
 @lru_cache
 def get_browser_control_event_service() -> BrowserControlEventService:
-    return BrowserControlEventService()
+    settings = get_settings()
+    return BrowserControlEventService(
+        broker=get_browser_control_event_broker(),
+        replay_buffer=EventReplayBuffer(
+            events_per_owner=settings.browser_control_replay_events_per_owner,
+            max_events=settings.browser_control_replay_max_events,
+            max_age_seconds=settings.browser_control_replay_max_age_seconds,
+        ),
+        keepalive_interval_seconds=settings.browser_control_sse_keepalive_seconds,
+        queue_max_size=settings.browser_control_event_queue_max_size,
+        backpressure_policy=settings.browser_control_backpressure_policy,
+    )
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable, Mapping
+from dataclasses import asdict
+from typing import Any
+
+from app.browser_control.services.browser_control_event_service import SubscriberQueueStats
+
+logger = logging.getLogger(__name__)
+
+# Subjects listed individually in a diagnostics line; the rest only count toward the totals.
+QUEUE_STATS_TOP_SUBJECTS = 10
+
+DiagnosticsSource = Callable[[], Any]
+
+
+def summarize_queue_stats(stats: Mapping[str, SubscriberQueueStats]) -> dict[str, Any]:
+    """Totals over every tracked subject plus the subjects that lost the most events."""
+    worst = sorted(
+        (item for item in stats.items() if item[1].dropped or item[1].disconnected),
+        key=lambda item: (item[1].dropped, item[1].disconnected),
+        reverse=True,
+    )[:QUEUE_STATS_TOP_SUBJECTS]
+    return {
+        "subjects": len(stats),
+        "dropped": sum(item.dropped for item in stats.values()),
+        "coalesced": sum(item.coalesced for item in stats.values()),
+        "disconnected": sum(item.disconnected for item in stats.values()),
+        "high_water_mark": max((item.high_water_mark for item in stats.values()), default=0),
+        "most_dropped": {subject: asdict(item) for subject, item in worst},
+    }
+
+
+def collect_diagnostics(sources: Mapping[str, DiagnosticsSource]) -> dict[str, Any]:
+    snapshot: dict[str, Any] = {}
+    for name, source in sources.items():
+        try:
+            snapshot[name] = source()
+        except Exception:
+            logger.exception("Collecting %s diagnostics failed.", name)
+    return snapshot
+
+
+async def log_diagnostics_periodically(
+    sources: Mapping[str, DiagnosticsSource],
+    *,
+    interval_seconds: float,
+) -> None:
+    """Logs one JSON line with every source's counters each interval."""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        logger.info(
+            "Diagnostics: %s",
+            json.dumps(collect_diagnostics(sources), default=_to_json, separators=(",", ":")),
+        )
+
+
+def _to_json(value: Any) -> Any:
+    # Stats snapshots are frozen dataclasses.
+    return asdict(value)
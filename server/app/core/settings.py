@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import AliasChoices, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,8 +14,51 @@ class Settings(BaseSettings):
     keycloak_expected_audience: str = Field(default="")
     keycloak_verify_ssl: bool = Field(default=False)
     keycloak_jwks_cache_ttl_seconds: int = Field(default=300, ge=30)
+    keycloak_jwks_refresh_ahead_seconds: int = Field(default=30, ge=0)
+    keycloak_jwks_max_staleness_seconds: int = Field(default=86_400, ge=30)
+    keycloak_jwks_snapshot_path: str = Field(default="")
+    keycloak_http_max_connections: int = Field(default=10, ge=1)
+    keycloak_jwks_min_forced_refresh_interval_seconds: int = Field(default=10, ge=0)
+    keycloak_unknown_kid_cache_ttl_seconds: int = Field(default=60, ge=1)
+    auth_token_cache_max_entries: int = Field(default=10_000, ge=0)
+    auth_token_cache_max_ttl_seconds: int = Field(default=300, ge=1)
+    auth_jwt_execution_mode: Literal["inline", "thread", "process"] = Field(default="inline")
+    auth_jwt_executor_max_workers: int = Field(default=4, ge=1)
+    auth_jwt_executor_max_pending: int = Field(default=256, ge=1)
     auth_required_role: str = Field(default="active")
+    auth_policy_default: str = Field(default="")
+    auth_policy_projects: str = Field(default="")
+    auth_policy_browser_control: str = Field(default="")
+    auth_policy_chat: str = Field(default="")
+    auth_policy_decision_cache_size: int = Field(default=4096, ge=0)
     cors_allow_origins: str = Field(default="*")
+    project_repository_backend: Literal["memory", "sqlite", "journal"] = Field(default="memory")
+    project_sqlite_path: str = Field(default="data/projects.sqlite3")
+    project_sqlite_pool_size: int = Field(default=4, ge=1, le=64)
+    project_repository_max_workers: int = Field(default=8, ge=1, le=64)
+    project_repository_slow_call_ms: int = Field(default=250, ge=1)
+    project_idempotency_ttl_seconds: int = Field(default=86_400, ge=1)
+    project_idempotency_max_entries: int = Field(default=10_000, ge=1)
+    project_json_cache_max_entries: int = Field(default=100_000, ge=0)
+    project_journal_dir: str = Field(default="data/projects-journal")
+    project_journal_fsync_interval_ms: int = Field(default=50, ge=1, le=10_000)
+    project_journal_compact_interval_seconds: float = Field(default=300.0, ge=1.0)
+    project_journal_compact_min_records: int = Field(default=10_000, ge=1)
+    browser_control_broker_backend: Literal["memory", "unix_socket"] = Field(default="memory")
+    browser_control_broker_socket_path: str = Field(default="data/browser-control-broker.sock")
+    browser_control_broker_max_peer_buffer_bytes: int = Field(default=1_048_576, ge=4096)
+    browser_control_event_queue_max_size: int = Field(default=100, ge=1)
+    browser_control_backpressure_policy: Literal[
+        "drop_oldest",
+        "drop_newest",
+        "coalesce",
+        "disconnect",
+    ] = Field(default="drop_oldest")
+    browser_control_sse_keepalive_seconds: float = Field(default=20.0, ge=1.0)
+    browser_control_replay_events_per_owner: int = Field(default=100, ge=0)
+    browser_control_replay_max_events: int = Field(default=100_000, ge=0)
+    browser_control_replay_max_age_seconds: float = Field(default=60.0, gt=0)
+    diagnostics_log_interval_seconds: float = Field(default=300.0, ge=0)
     chat_a2a_handler_name: str = Field(default="chatbot")
     chat_ollama_base_url: str = Field(default="http://localhost:11434")
     chat_ollama_model: str = Field(default="qwen3:8b")
@@ -53,6 +98,20 @@ class Settings(BaseSettings):
     def required_role(self) -> str:
         return self.auth_required_role.strip()
 
+    def access_policy_expressions(self) -> dict[str, str]:
+        default = self.auth_policy_default.strip()
+        if not default:
+            if not self.required_role:
+                raise ValueError("AUTH_POLICY_DEFAULT or AUTH_REQUIRED_ROLE must be set.")
+            default = f"role:{self.required_role}"
+
+        return {
+            "default": default,
+            "projects": self.auth_policy_projects.strip() or default,
+            "browser_control": self.auth_policy_browser_control.strip() or default,
+            "chat": self.auth_policy_chat.strip() or default,
+        }
+
     @property
     def chat_handler_name(self) -> str:
         name = self.chat_a2a_handler_name.strip()
@@ -1,14 +1,77 @@
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
+from app.auth.dependencies import get_auth_service, get_token_verifier
+from app.browser_control.infrastructure.unix_socket_event_broker import UnixSocketEventBroker
 from app.chat.infrastructure.a2a_app_factory import create_chat_a2a_app
-from app.core.dependencies import get_settings
+from app.core.dependencies import (
+    get_async_project_repository,
+    get_browser_control_event_broker,
+    get_browser_control_event_service,
+    get_settings,
+)
+from app.core.diagnostics import (
+    DiagnosticsSource,
+    log_diagnostics_periodically,
+    summarize_queue_stats,
+)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    auth_service = get_auth_service()
+    project_repository = get_async_project_repository()
+    browser_control_events = get_browser_control_event_service()
+    await project_repository.start()
+    await auth_service.start()
+    await browser_control_events.start()
+    diagnostics_task = _start_diagnostics_log()
+    try:
+        yield
+    finally:
+        if diagnostics_task is not None:
+            diagnostics_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await diagnostics_task
+        await browser_control_events.close()
+        await auth_service.close()
+        await project_repository.close()
+
+
+def _start_diagnostics_log() -> asyncio.Task[None] | None:
+    interval_seconds = get_settings().diagnostics_log_interval_seconds
+    if interval_seconds <= 0:
+        return None
+
+    token_verifier = get_token_verifier()
+    project_repository = get_async_project_repository()
+    browser_control_events = get_browser_control_event_service()
+    sources: dict[str, DiagnosticsSource] = {
+        "auth_token_cache": token_verifier.token_cache_stats,
+        "project_repository_calls": project_repository.call_stats,
+        "browser_control_replay": browser_control_events.replay_stats,
+        "browser_control_queues": lambda: summarize_queue_stats(
+            browser_control_events.queue_stats()
+        ),
+    }
+    broker = get_browser_control_event_broker()
+    if isinstance(broker, UnixSocketEventBroker):
+        sources["browser_control_broker"] = broker.stats
+    return asyncio.create_task(
+        log_diagnostics_periodically(sources, interval_seconds=interval_seconds),
+        name="diagnostics-log",
+    )
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
-    app = FastAPI(title=settings.app_name, debug=settings.debug)
+    app = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -12,3 +12,26 @@ class Project:
     description: str | None
     created_at: datetime
 
+
+@dataclass(slots=True, frozen=True)
+class ProjectDraft:
+    name: str
+    description: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class ProjectCursor:
+    """Keyset position: the (created_at, id) of the last project on a page."""
+
+    created_at: datetime
+    id: str
+
+    @classmethod
+    def after(cls, project: Project) -> ProjectCursor:
+        return cls(created_at=project.created_at, id=project.id)
+
+
+@dataclass(slots=True, frozen=True)
+class ProjectPage:
+    items: list[Project]
+    next_cursor: ProjectCursor | None
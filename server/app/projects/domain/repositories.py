@@ -1,10 +1,30 @@
+from collections.abc import Sequence
 from typing import Protocol
 
-from app.projects.domain.models import Project
+from app.projects.domain.models import Project, ProjectCursor, ProjectDraft, ProjectPage
 
 
 class ProjectRepository(Protocol):
-    def list_by_owner(self, owner_subject: str) -> list[Project]:
+    def get_owner_version(self, owner_subject: str) -> int:
+        ...
+
+    def list_page_by_owner(
+        self,
+        owner_subject: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        ...
+
+    def search_page_by_owner(
+        self,
+        owner_subject: str,
+        normalized_query: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
         ...
 
     def create(
@@ -15,3 +35,60 @@ class ProjectRepository(Protocol):
     ) -> Project:
         ...
 
+    def create_many(
+        self,
+        owner_subject: str,
+        drafts: Sequence[ProjectDraft],
+    ) -> list[Project]:
+        ...
+
+    def start(self) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class AsyncProjectRepository(Protocol):
+    async def get_owner_version(self, owner_subject: str) -> int:
+        ...
+
+    async def list_page_by_owner(
+        self,
+        owner_subject: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        ...
+
+    async def search_page_by_owner(
+        self,
+        owner_subject: str,
+        normalized_query: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        ...
+
+    async def create(
+        self,
+        owner_subject: str,
+        name: str,
+        description: str | None,
+    ) -> Project:
+        ...
+
+    async def create_many(
+        self,
+        owner_subject: str,
+        drafts: Sequence[ProjectDraft],
+    ) -> list[Project]:
+        ...
+
+    async def start(self) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
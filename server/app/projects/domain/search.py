@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from itertools import islice
+
+from app.projects.domain.models import Project
+
+# Only trigrams are indexed, which keeps the index to about one entry per
+# character. One- and two-character queries have no trigram and are answered by
+# a bounded newest-first scan instead.
+GRAM_LENGTH = 3
+# Projects a short query examines per page before handing back a cursor.
+SHORT_QUERY_SCAN_LIMIT = 5000
+
+
+def normalize_search_text(value: str) -> str:
+    return value.casefold()
+
+
+def _grams(value: str, size: int) -> set[str]:
+    return {value[start:start + size] for start in range(len(value) - size + 1)}
+
+
+def project_search_grams(project: Project) -> set[str]:
+    grams: set[str] = set()
+    for field_value in (project.name, project.description):
+        if field_value:
+            grams |= _grams(normalize_search_text(field_value), GRAM_LENGTH)
+    return grams
+
+
+def query_search_grams(normalized_query: str) -> set[str]:
+    """Trigrams of the query; empty when it is too short to use the index."""
+    return _grams(normalized_query, GRAM_LENGTH)
+
+
+def project_matches_query(project: Project, normalized_query: str) -> bool:
+    if normalized_query in normalize_search_text(project.name):
+        return True
+    return bool(project.description) and normalized_query in normalize_search_text(
+        project.description
+    )
+
+
+def scan_for_matches(
+    newest_first: Iterable[Project],
+    normalized_query: str,
+    *,
+    limit: int,
+) -> tuple[list[Project], Project | None]:
+    """Matches among the first SHORT_QUERY_SCAN_LIMIT projects, and where to resume.
+
+    The resume point is the last match when more remain, or the last project
+    examined when the scan budget ran out first; then the page may be short.
+    """
+    matches: list[Project] = []
+    examined = 0
+    last: Project | None = None
+    for project in islice(newest_first, SHORT_QUERY_SCAN_LIMIT):
+        examined += 1
+        last = project
+        if not project_matches_query(project, normalized_query):
+            continue
+        if len(matches) == limit:
+            return matches, matches[-1]
+        matches.append(project)
+    if examined == SHORT_QUERY_SCAN_LIMIT:
+        return matches, last
+    return matches, None
@@ -1,20 +1,215 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import os
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
 from threading import Lock
-from uuid import uuid4
+from time import time_ns
+from typing import ClassVar, overload
+from uuid import UUID
 
-from app.projects.domain.models import Project
+from app.projects.domain.models import Project, ProjectCursor, ProjectDraft, ProjectPage
+from app.projects.infrastructure.project_journal import ProjectJournal
+from app.projects.infrastructure.project_search_index import ProjectSearchIndex
 
+LOCK_STRIPES = 64
+# Smallest gap between an owner's creation timestamps, keeping them strictly increasing.
+CREATED_AT_STEP = timedelta(microseconds=1)
+# Project IDs cut from one os.urandom call.
+PROJECT_ID_BATCH_SIZE = 256
+
+
+def _sort_key(project: Project) -> tuple[datetime, str]:
+    return (project.created_at, project.id)
+
+
+def _random_project_ids(count: int) -> list[str]:
+    random_bytes = os.urandom(16 * count)
+    return [
+        str(UUID(bytes=random_bytes[start:start + 16], version=4))
+        for start in range(0, len(random_bytes), 16)
+    ]
+
+
+class _ProjectIdPool:
+    """uuid4 IDs handed out from batches of random bytes.
+
+    os.urandom releases the GIL, and a thread that gives up the GIL waits
+    behind every busy thread to get it back. Calling it once per create
+    let lock-free reader threads starve writers; a batch pays that once
+    per PROJECT_ID_BATCH_SIZE projects. list.pop/extend are atomic, so
+    no lock is needed.
+    """
+
+    __slots__ = ("_ids",)
 
-class InMemoryProjectRepository:
     def __init__(self) -> None:
-        self._projects: dict[str, list[Project]] = {}
-        self._lock = Lock()
+        self._ids: list[str] = []
+
+    def take(self, count: int) -> list[str]:
+        if count >= PROJECT_ID_BATCH_SIZE:
+            return _random_project_ids(count)
+        taken: list[str] = []
+        while len(taken) < count:
+            try:
+                taken.append(self._ids.pop())
+            except IndexError:
+                fresh = _random_project_ids(PROJECT_ID_BATCH_SIZE)
+                taken.append(fresh.pop())
+                self._ids.extend(fresh)
+        return taken
+
+
+class ProjectSnapshot(Sequence[Project]):
+    """Immutable newest-first view over the first `count` items of an append-only list.
+
+    Writers only append past `count` (or publish a fresh list), so a snapshot
+    never changes after it is published and readers need no lock. The search
+    index shares the list's lifetime and follows the same append-only rule.
+    """
+
+    __slots__ = ("_items", "_count", "_search_index")
+
+    def __init__(self, items: list[Project], count: int, search_index: ProjectSearchIndex) -> None:
+        self._items = items
+        self._count = count
+        self._search_index = search_index
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> Project: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Project]: ...
+
+    def __getitem__(self, index: int | slice) -> Project | list[Project]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("project snapshot index out of range")
+        return self._items[self._count - 1 - index]
+
+    def __iter__(self) -> Iterator[Project]:
+        items = self._items
+        for position in range(self._count - 1, -1, -1):
+            yield items[position]
+
+    def oldest_first(self) -> list[Project]:
+        return self._items
+
+    def end_before(self, after: ProjectCursor | None) -> int:
+        if after is None:
+            return self._count
+        return bisect_left(
+            self._items,
+            (after.created_at, after.id),
+            hi=self._count,
+            key=_sort_key,
+        )
+
+    def search(
+        self,
+        normalized_query: str,
+        *,
+        end: int,
+        limit: int,
+    ) -> tuple[list[Project], Project | None]:
+        return self._search_index.search(self._items, normalized_query, end=end, limit=limit)
 
-    def list_by_owner(self, owner_subject: str) -> list[Project]:
-        with self._lock:
-            return list(self._projects.get(owner_subject, []))
+    def extended(self, projects: Sequence[Project]) -> ProjectSnapshot:
+        items, count = self._items, self._count
+        ordered = sorted(projects, key=_sort_key)
+        if not ordered:
+            return self
+        if len(items) == count and (not count or _sort_key(items[-1]) <= _sort_key(ordered[0])):
+            # Common case: amortized O(1) append, invisible to older snapshots.
+            items.extend(ordered)
+            for position, project in enumerate(ordered, start=count):
+                self._search_index.add(position, project)
+            return ProjectSnapshot(items, count + len(ordered), self._search_index)
+
+        # Out-of-order timestamp: copy so published snapshots stay unchanged.
+        # Positions shift, so the search index is rebuilt for the new list.
+        copied = items[:count] + ordered
+        copied.sort(key=_sort_key)
+        return ProjectSnapshot(copied, len(copied), ProjectSearchIndex.build(copied))
+
+    @classmethod
+    def empty(cls) -> ProjectSnapshot:
+        return cls([], 0, ProjectSearchIndex())
+
+
+_EMPTY_SNAPSHOT = ProjectSnapshot.empty()
+
+
+class InMemoryProjectRepository:
+    # Lock-free snapshot reads; safe to call directly on the event loop.
+    nonblocking_methods: ClassVar[frozenset[str]] = frozenset(
+        {"get_owner_version", "list_page_by_owner", "search_page_by_owner"}
+    )
+
+    def __init__(self, *, journal: ProjectJournal | None = None) -> None:
+        self._snapshots: dict[str, ProjectSnapshot] = {}
+        # Versions start at a per-instance value so ETags issued before a
+        # restart never match the rebuilt lists.
+        self._initial_version = time_ns()
+        self._versions: dict[str, int] = {}
+        self._locks = tuple(Lock() for _ in range(LOCK_STRIPES))
+        self._project_ids = _ProjectIdPool()
+        self._journal = journal
+        if journal is not None:
+            self._restore(journal.recover())
+
+    def _restore(self, projects: Iterable[Project]) -> None:
+        projects_by_owner: dict[str, list[Project]] = {}
+        for project in projects:
+            projects_by_owner.setdefault(project.owner_subject, []).append(project)
+        for owner_subject, owned_projects in projects_by_owner.items():
+            self._snapshots[owner_subject] = ProjectSnapshot.empty().extended(owned_projects)
+
+    def _lock_for(self, owner_subject: str) -> Lock:
+        return self._locks[hash(owner_subject) % LOCK_STRIPES]
+
+    def get_owner_version(self, owner_subject: str) -> int:
+        return self._versions.get(owner_subject, self._initial_version)
+
+    def list_page_by_owner(
+        self,
+        owner_subject: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        snapshot = self._snapshots.get(owner_subject, _EMPTY_SNAPSHOT)
+        projects = snapshot.oldest_first()
+        end = snapshot.end_before(after)
+        start = max(0, end - limit)
+        items = [projects[position] for position in range(end - 1, start - 1, -1)]
+
+        next_cursor = ProjectCursor.after(items[-1]) if start > 0 and items else None
+        return ProjectPage(items=items, next_cursor=next_cursor)
+
+    def search_page_by_owner(
+        self,
+        owner_subject: str,
+        normalized_query: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        snapshot = self._snapshots.get(owner_subject, _EMPTY_SNAPSHOT)
+        items, resume_after = snapshot.search(
+            normalized_query,
+            end=snapshot.end_before(after),
+            limit=limit,
+        )
+        next_cursor = ProjectCursor.after(resume_after) if resume_after else None
+        return ProjectPage(items=items, next_cursor=next_cursor)
 
     def create(
         self,
@@ -22,14 +217,56 @@ class InMemoryProjectRepository:
         name: str,
         description: str | None,
     ) -> Project:
-        project = Project(
-            id=str(uuid4()),
-            owner_subject=owner_subject,
-            name=name,
-            description=description,
-            created_at=datetime.now(timezone.utc),
-        )
-        with self._lock:
-            self._projects.setdefault(owner_subject, []).insert(0, project)
-        return project
+        return self._publish(owner_subject, (ProjectDraft(name=name, description=description),))[0]
+
+    def create_many(
+        self,
+        owner_subject: str,
+        drafts: Sequence[ProjectDraft],
+    ) -> list[Project]:
+        if not drafts:
+            return []
+        # One lock acquisition and one snapshot publish for the whole batch.
+        return self._publish(owner_subject, drafts)
+
+    def _publish(self, owner_subject: str, drafts: Sequence[ProjectDraft]) -> list[Project]:
+        # Drawn before locking, so a refill never gives up the GIL under the owner's lock.
+        project_ids = self._project_ids.take(len(drafts))
+        with self._lock_for(owner_subject):
+            snapshot = self._snapshots.get(owner_subject, _EMPTY_SNAPSHOT)
+            if snapshot is _EMPTY_SNAPSHOT:
+                snapshot = ProjectSnapshot.empty()
+            # Timestamps are taken under the owner's lock and never go backwards,
+            # so every publish takes the snapshot's append-only fast path.
+            created_at = datetime.now(timezone.utc)
+            if snapshot:
+                created_at = max(created_at, snapshot[0].created_at + CREATED_AT_STEP)
+            projects: list[Project] = []
+            for project_id, draft in zip(project_ids, drafts):
+                projects.append(
+                    Project(
+                        id=project_id,
+                        owner_subject=owner_subject,
+                        name=draft.name,
+                        description=draft.description,
+                        created_at=created_at,
+                    )
+                )
+                created_at += CREATED_AT_STEP
+            if self._journal is not None:
+                # Logged before publishing, so a visible project is always recoverable.
+                self._journal.append(projects)
+            self._snapshots[owner_subject] = snapshot.extended(projects)
+            # Bumped after publishing, so a reader that saw this version also sees the projects.
+            self._versions[owner_subject] = (
+                self._versions.get(owner_subject, self._initial_version) + 1
+            )
+        return projects
+
+    def start(self) -> None:
+        if self._journal is not None:
+            self._journal.start()
 
+    def close(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import Any, Literal
+
+from app.projects.domain.models import Project, ProjectCursor, ProjectDraft, ProjectPage
+from app.projects.domain.repositories import AsyncProjectRepository, ProjectRepository
+
+logger = logging.getLogger(__name__)
+
+CallMode = Literal["await", "inline", "thread"]
+
+REPOSITORY_METHODS = (
+    "get_owner_version",
+    "list_page_by_owner",
+    "search_page_by_owner",
+    "create",
+    "create_many",
+    "start",
+    "close",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class RepositoryCallStats:
+    calls: int
+    errors: int
+    total_seconds: float
+    max_seconds: float
+    # Time spent waiting for a free pool thread; grows when the pool is saturated.
+    total_queue_seconds: float
+
+
+class _CallStatsRecorder:
+    __slots__ = ("calls", "errors", "total_seconds", "max_seconds", "total_queue_seconds")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.total_queue_seconds = 0.0
+
+    def snapshot(self) -> RepositoryCallStats:
+        return RepositoryCallStats(
+            calls=self.calls,
+            errors=self.errors,
+            total_seconds=self.total_seconds,
+            max_seconds=self.max_seconds,
+            total_queue_seconds=self.total_queue_seconds,
+        )
+
+
+class OffloadingProjectRepository:
+    """AsyncProjectRepository over any backend, with per-call latency stats.
+
+    Coroutine methods are awaited directly. Sync methods run on a bounded
+    thread pool, except those the backend lists in `nonblocking_methods`,
+    which are cheap enough to call on the event loop.
+    """
+
+    def __init__(
+        self,
+        repository: ProjectRepository | AsyncProjectRepository,
+        *,
+        max_workers: int,
+        slow_call_seconds: float,
+    ) -> None:
+        self._repository = repository
+        self._slow_call_seconds = slow_call_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="project-repository",
+        )
+        nonblocking_methods: frozenset[str] = getattr(
+            repository,
+            "nonblocking_methods",
+            frozenset(),
+        )
+        self._modes: dict[str, CallMode] = {}
+        for name in REPOSITORY_METHODS:
+            method = getattr(repository, name)
+            if inspect.iscoroutinefunction(method):
+                self._modes[name] = "await"
+            elif name in nonblocking_methods:
+                self._modes[name] = "inline"
+            else:
+                self._modes[name] = "thread"
+        self._stats_lock = Lock()
+        self._stats = {name: _CallStatsRecorder() for name in REPOSITORY_METHODS}
+
+    def call_stats(self) -> dict[str, RepositoryCallStats]:
+        with self._stats_lock:
+            return {name: recorder.snapshot() for name, recorder in self._stats.items()}
+
+    async def get_owner_version(self, owner_subject: str) -> int:
+        return await self._call("get_owner_version", owner_subject)
+
+    async def list_page_by_owner(
+        self,
+        owner_subject: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        return await self._call("list_page_by_owner", owner_subject, limit=limit, after=after)
+
+    async def search_page_by_owner(
+        self,
+        owner_subject: str,
+        normalized_query: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        return await self._call(
+            "search_page_by_owner",
+            owner_subject,
+            normalized_query,
+            limit=limit,
+            after=after,
+        )
+
+    async def create(
+        self,
+        owner_subject: str,
+        name: str,
+        description: str | None,
+    ) -> Project:
+        return await self._call(
+            "create",
+            owner_subject=owner_subject,
+            name=name,
+            description=description,
+        )
+
+    async def create_many(
+        self,
+        owner_subject: str,
+        drafts: Sequence[ProjectDraft],
+    ) -> list[Project]:
+        return await self._call("create_many", owner_subject, drafts)
+
+    async def start(self) -> None:
+        await self._call("start")
+
+    async def close(self) -> None:
+        try:
+            await self._call("close")
+        finally:
+            self._executor.shutdown(wait=True)
+
+    async def _call(self, method_name: str, /, *args: Any, **kwargs: Any) -> Any:
+        method: Callable[..., Any] = getattr(self._repository, method_name)
+        mode = self._modes[method_name]
+        started_at = perf_counter()
+        queue_seconds = 0.0
+        failed = False
+        try:
+            if mode == "await":
+                return await method(*args, **kwargs)
+            if mode == "inline":
+                return method(*args, **kwargs)
+
+            def run() -> tuple[float, Any]:
+                return perf_counter(), method(*args, **kwargs)
+
+            running_at, result = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                run,
+            )
+            queue_seconds = running_at - started_at
+            return result
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self._record(method_name, perf_counter() - started_at, queue_seconds, failed)
+
+    def _record(self, name: str, elapsed: float, queue_seconds: float, failed: bool) -> None:
+        with self._stats_lock:
+            recorder = self._stats[name]
+            recorder.calls += 1
+            recorder.errors += failed
+            recorder.total_seconds += elapsed
+            recorder.total_queue_seconds += queue_seconds
+            if elapsed > recorder.max_seconds:
+                recorder.max_seconds = elapsed
+        if elapsed >= self._slow_call_seconds:
+            logger.warning(
+                "Slow project repository call %s: %.1f ms (%.1f ms waiting for a worker).",
+                name,
+                elapsed * 1000,
+                queue_seconds * 1000,
+            )
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import mmap
+import os
+from collections.abc import Callable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import BinaryIO
+
+from app.projects.domain.models import Project
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "journal-"
+SEGMENT_SUFFIX = ".log"
+SNAPSHOT_PREFIX = "snapshot-"
+SNAPSHOT_SUFFIX = ".ndjson"
+LOCK_FILE_NAME = "journal.lock"
+COPY_CHUNK_BYTES = 1024 * 1024
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _encode_project(project: Project) -> bytes:
+    record = {
+        "id": project.id,
+        "owner_subject": project.owner_subject,
+        "name": project.name,
+        "description": project.description,
+        "created_at_us": (project.created_at - EPOCH) // timedelta(microseconds=1),
+    }
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _decode_project(line: bytes) -> Project:
+    record = json.loads(line)
+    return Project(
+        id=record["id"],
+        owner_subject=record["owner_subject"],
+        name=record["name"],
+        description=record["description"],
+        created_at=EPOCH + timedelta(microseconds=record["created_at_us"]),
+    )
+
+
+def _sequence_of(path: Path, prefix: str, suffix: str) -> int | None:
+    name = path.name
+    if not name.startswith(prefix) or not name.endswith(suffix):
+        return None
+    digits = name[len(prefix):-len(suffix)]
+    return int(digits) if digits.isdigit() else None
+
+
+def _complete_length(data: mmap.mmap) -> int:
+    # A crash can leave a torn last record; everything after the last newline is ignored.
+    return data.rfind(b"\n") + 1
+
+
+def _read_projects(path: Path) -> Iterator[Project]:
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            end = _complete_length(data)
+            start = 0
+            while start < end:
+                newline = data.find(b"\n", start, end)
+                try:
+                    yield _decode_project(data[start:newline])
+                except (ValueError, KeyError, TypeError) as error:
+                    logger.warning("Skipping corrupt project record in %s: %s", path, error)
+                start = newline + 1
+
+
+class ProjectJournal:
+    """Append-only project log with batched fsync and periodic snapshot compaction.
+
+    Records go to the active `journal-N.log` segment and are fsynced by a
+    background thread every `fsync_interval_seconds`, so a crash loses at most
+    that window. Compaction seals the active segment and folds it, older
+    segments and the previous snapshot into `snapshot-N.ndjson`; recovery reads
+    the newest snapshot through mmap and replays the segments after it.
+
+    Segment numbering and compaction assume a single writer, so the directory
+    is held under an exclusive `flock` from construction until `close()`.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        fsync_interval_seconds: float,
+        compact_interval_seconds: float,
+        compact_min_records: int,
+    ) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._lock_file: BinaryIO | None = self._acquire_directory_lock()
+        self._fsync_interval_seconds = fsync_interval_seconds
+        self._compact_interval_seconds = compact_interval_seconds
+        self._compact_min_records = compact_min_records
+        self._lock = Lock()
+        self._compaction_lock = Lock()
+        self._stopping = Event()
+        self._threads: list[Thread] = []
+        self._active_sequence = 0
+        self._active_file: BinaryIO | None = None
+        self._dirty = False
+        self._records_since_snapshot = 0
+
+    def _acquire_directory_lock(self) -> BinaryIO:
+        lock_file = (self._directory / LOCK_FILE_NAME).open("ab")
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as error:
+            lock_file.close()
+            raise RuntimeError(
+                f"Project journal directory {self._directory} is already in use by another process."
+            ) from error
+        return lock_file
+
+    def _paths(self, prefix: str, suffix: str) -> list[tuple[int, Path]]:
+        found = []
+        for path in self._directory.iterdir():
+            sequence = _sequence_of(path, prefix, suffix)
+            if sequence is not None:
+                found.append((sequence, path))
+        return sorted(found)
+
+    def recover(self) -> Iterator[Project]:
+        """Yields every stored project, then opens a fresh segment for appends."""
+        for stale in self._directory.glob("*.tmp"):
+            stale.unlink()
+
+        snapshots = self._paths(SNAPSHOT_PREFIX, SNAPSHOT_SUFFIX)
+        snapshot_sequence = snapshots[-1][0] if snapshots else 0
+        if snapshots:
+            yield from _read_projects(snapshots[-1][1])
+
+        segments = self._paths(SEGMENT_PREFIX, SEGMENT_SUFFIX)
+        replayed = 0
+        for sequence, path in segments:
+            if sequence <= snapshot_sequence:
+                continue
+            if path.stat().st_size == 0:
+                # Left behind by a run that never wrote anything.
+                path.unlink()
+                continue
+            for project in _read_projects(path):
+                replayed += 1
+                yield project
+
+        last_sequence = max([snapshot_sequence, *(sequence for sequence, _ in segments)])
+        with self._lock:
+            self._records_since_snapshot = replayed
+            self._open_segment_locked(last_sequence + 1)
+
+    def start(self) -> None:
+        for name, interval, action in (
+            ("project-journal-fsync", self._fsync_interval_seconds, self.flush),
+            ("project-journal-compact", self._compact_interval_seconds, self.compact),
+        ):
+            thread = Thread(
+                target=self._run_periodically,
+                args=(interval, action),
+                name=name,
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def append(self, projects: Sequence[Project]) -> None:
+        payload = b"".join([_encode_project(project) for project in projects])
+        with self._lock:
+            if self._active_file is None:
+                raise RuntimeError("Project journal is not open.")
+            self._active_file.write(payload)
+            self._dirty = True
+            self._records_since_snapshot += len(projects)
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._dirty or self._active_file is None:
+                return
+            self._active_file.flush()
+            self._dirty = False
+            # fsync a duplicate outside the lock so appends are not blocked on the
+            # disk, and a concurrent rotation cannot close the descriptor under us.
+            descriptor = os.dup(self._active_file.fileno())
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def compact(self) -> bool:
+        with self._compaction_lock:
+            with self._lock:
+                if self._active_file is None:
+                    return False
+                if self._records_since_snapshot < self._compact_min_records:
+                    return False
+                sealed_sequence = self._active_sequence
+                sealed_records = self._records_since_snapshot
+                self._records_since_snapshot = 0
+                self._open_segment_locked(sealed_sequence + 1)
+
+            try:
+                self._write_snapshot(sealed_sequence)
+            except BaseException:
+                with self._lock:
+                    self._records_since_snapshot += sealed_records
+                raise
+            return True
+
+    def close(self) -> None:
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads.clear()
+        with self._lock:
+            self._close_segment_locked()
+        if self._lock_file is not None:
+            # Closing the descriptor releases the flock.
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _run_periodically(self, interval: float, action: Callable[[], object]) -> None:
+        while not self._stopping.wait(interval):
+            try:
+                action()
+            except Exception:
+                logger.exception("Project journal background %s failed.", action.__name__)
+
+    def _open_segment_locked(self, sequence: int) -> None:
+        self._close_segment_locked()
+        path = self._directory / f"{SEGMENT_PREFIX}{sequence:08d}{SEGMENT_SUFFIX}"
+        self._active_file = path.open("ab")
+        self._active_sequence = sequence
+        self._fsync_directory()
+
+    def _close_segment_locked(self) -> None:
+        if self._active_file is None:
+            return
+        self._active_file.flush()
+        os.fsync(self._active_file.fileno())
+        self._active_file.close()
+        self._active_file = None
+        self._dirty = False
+
+    def _write_snapshot(self, sealed_sequence: int) -> None:
+        snapshots = [
+            (sequence, path)
+            for sequence, path in self._paths(SNAPSHOT_PREFIX, SNAPSHOT_SUFFIX)
+            if sequence <= sealed_sequence
+        ]
+        segments = [
+            (sequence, path)
+            for sequence, path in self._paths(SEGMENT_PREFIX, SEGMENT_SUFFIX)
+            if sequence <= sealed_sequence
+        ]
+        previous_sequence = snapshots[-1][0] if snapshots else 0
+        sources = [snapshots[-1][1]] if snapshots else []
+        sources += [path for sequence, path in segments if sequence > previous_sequence]
+
+        target = self._directory / f"{SNAPSHOT_PREFIX}{sealed_sequence:08d}{SNAPSHOT_SUFFIX}"
+        temporary = target.with_name(f"{target.name}.tmp")
+        with temporary.open("wb") as output:
+            for source in sources:
+                self._copy_complete_records(source, output)
+            output.flush()
+            os.fsync(output.fileno())
+        os.replace(temporary, target)
+        self._fsync_directory()
+
+        for _, path in snapshots:
+            if path != target:
+                path.unlink(missing_ok=True)
+        for _, path in segments:
+            path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _copy_complete_records(source: Path, output: BinaryIO) -> None:
+        with source.open("rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                end = _complete_length(data)
+                for start in range(0, end, COPY_CHUNK_BYTES):
+                    output.write(data[start:min(end, start + COPY_CHUNK_BYTES)])
+
+    def _fsync_directory(self) -> None:
+        descriptor = os.open(self._directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
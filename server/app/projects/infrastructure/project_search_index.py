@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Sequence
+
+from app.projects.domain.models import Project
+from app.projects.domain.search import (
+    project_matches_query,
+    project_search_grams,
+    query_search_grams,
+    scan_for_matches,
+)
+
+
+def _contains(posting: list[int], position: int) -> bool:
+    index = bisect_left(posting, position)
+    return index < len(posting) and posting[index] == position
+
+
+class ProjectSearchIndex:
+    """Append-only trigram -> ascending positions index over one owner's oldest-first list.
+
+    Positions are only ever appended, so readers that stop at their snapshot's
+    length see a consistent index without locking.
+    """
+
+    __slots__ = ("_postings",)
+
+    def __init__(self) -> None:
+        # Readers only call .get(), so a missing gram is never inserted outside a writer.
+        self._postings: defaultdict[str, list[int]] = defaultdict(list)
+
+    @classmethod
+    def build(cls, projects: Sequence[Project]) -> ProjectSearchIndex:
+        index = cls()
+        for position, project in enumerate(projects):
+            index.add(position, project)
+        return index
+
+    def add(self, position: int, project: Project) -> None:
+        postings = self._postings
+        for gram in project_search_grams(project):
+            postings[gram].append(position)
+
+    def search(
+        self,
+        projects: Sequence[Project],
+        normalized_query: str,
+        *,
+        end: int,
+        limit: int,
+    ) -> tuple[list[Project], Project | None]:
+        """Newest-first matches among positions below `end`, and the project to resume after."""
+        grams = query_search_grams(normalized_query)
+        if not grams:
+            newest_first = (projects[position] for position in range(end - 1, -1, -1))
+            return scan_for_matches(newest_first, normalized_query, limit=limit)
+
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is None:
+                return [], None
+            postings.append(posting)
+
+        # Walk the rarest gram's positions, pre-filter on the next rarest one and
+        # let the substring check settle the rest; probing common grams costs
+        # more than it filters.
+        postings.sort(key=len)
+        driver = postings[0]
+        second = postings[1] if len(postings) > 1 else None
+        matches: list[Project] = []
+        cursor = bisect_left(driver, end)
+        while cursor > 0 and len(matches) <= limit:
+            cursor -= 1
+            position = driver[cursor]
+            if second is not None and not _contains(second, position):
+                continue
+            project = projects[position]
+            if project_matches_query(project, normalized_query):
+                matches.append(project)
+        if len(matches) > limit:
+            return matches[:limit], matches[limit - 1]
+        return matches, None
@@ -0,0 +1,356 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from queue import Empty, LifoQueue
+from uuid import uuid4
+
+from app.projects.domain.models import Project, ProjectCursor, ProjectDraft, ProjectPage
+from app.projects.domain.search import (
+    SHORT_QUERY_SCAN_LIMIT,
+    project_matches_query,
+    project_search_grams,
+    query_search_grams,
+    scan_for_matches,
+)
+
+SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS projects (
+        id TEXT PRIMARY KEY,
+        owner_subject TEXT NOT NULL,
+        name TEXT NOT NULL,
+        description TEXT,
+        created_at_us INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_projects_owner_created
+    ON projects (owner_subject, created_at_us DESC, id DESC)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS project_owner_versions (
+        owner_subject TEXT PRIMARY KEY,
+        version INTEGER NOT NULL
+    ) WITHOUT ROWID
+    """,
+    # Contentless FTS5 index keyed by the projects rowid. Each project is stored
+    # as owner-prefixed trigram terms (see _gram_terms), so a query only walks
+    # its owner's postings, and FTS5 merges small segments instead of touching
+    # one B-tree page per gram on every insert.
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS project_search USING fts5(
+        terms, content='', detail='none', tokenize='ascii'
+    )
+    """,
+)
+# Bumped when a schema change needs existing rows backfilled (see _migrate).
+SCHEMA_VERSION = 1
+
+# Constant SQL text so sqlite3's per-connection statement cache reuses the
+# prepared statements across calls.
+SELECT_FIRST_PAGE_SQL = (
+    "SELECT id, owner_subject, name, description, created_at_us FROM projects "
+    "WHERE owner_subject = ? ORDER BY created_at_us DESC, id DESC LIMIT ?"
+)
+SELECT_PAGE_AFTER_SQL = (
+    "SELECT id, owner_subject, name, description, created_at_us FROM projects "
+    "WHERE owner_subject = ? AND (created_at_us, id) < (?, ?) "
+    "ORDER BY created_at_us DESC, id DESC LIMIT ?"
+)
+SELECT_LATEST_CREATED_AT_SQL = (
+    "SELECT created_at_us FROM projects WHERE owner_subject = ? "
+    "ORDER BY created_at_us DESC, id DESC LIMIT 1"
+)
+SELECT_OWNER_VERSION_SQL = "SELECT version FROM project_owner_versions WHERE owner_subject = ?"
+BUMP_OWNER_VERSION_SQL = (
+    "INSERT INTO project_owner_versions (owner_subject, version) VALUES (?, 1) "
+    "ON CONFLICT (owner_subject) DO UPDATE SET version = version + 1"
+)
+# FTS5 yields rows in rowid order, which is each owner's created_at order
+# because create_many never lets an owner's timestamps go backwards.
+SEARCH_FIRST_PAGE_SQL = (
+    "SELECT p.id, p.owner_subject, p.name, p.description, p.created_at_us "
+    "FROM project_search AS s JOIN projects AS p ON p.rowid = s.rowid "
+    "WHERE project_search MATCH ? ORDER BY s.rowid DESC"
+)
+SEARCH_PAGE_AFTER_SQL = (
+    "SELECT p.id, p.owner_subject, p.name, p.description, p.created_at_us "
+    "FROM project_search AS s JOIN projects AS p ON p.rowid = s.rowid "
+    "WHERE project_search MATCH ? AND s.rowid < (SELECT rowid FROM projects WHERE id = ?) "
+    "ORDER BY s.rowid DESC"
+)
+INSERT_SEARCH_TERMS_SQL = (
+    "INSERT INTO project_search (rowid, terms) SELECT rowid, ? FROM projects WHERE id = ?"
+)
+SELECT_ALL_SQL = "SELECT id, owner_subject, name, description, created_at_us FROM projects"
+INSERT_SQL = (
+    "INSERT INTO projects (id, owner_subject, name, description, created_at_us) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+POOL_ACQUIRE_TIMEOUT_SECONDS = 5.0
+BUSY_TIMEOUT_MILLISECONDS = 5000
+
+
+def _to_microseconds(value: datetime) -> int:
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def _from_microseconds(value: int) -> datetime:
+    return EPOCH + timedelta(microseconds=value)
+
+
+def _gram_terms(owner_subject: str, grams: Iterable[str]) -> Iterator[str]:
+    # A short owner prefix scopes each term to one owner; a hash collision only
+    # adds rows that the owner check in search_page_by_owner drops. Hex keeps
+    # every gram a single token for the ascii tokenizer.
+    owner_key = hashlib.blake2b(owner_subject.encode("utf-8"), digest_size=4).hexdigest()
+    for gram in grams:
+        yield owner_key + gram.encode("utf-8").hex()
+
+
+def _search_terms_row(project: Project) -> tuple[str, str]:
+    terms = " ".join(_gram_terms(project.owner_subject, project_search_grams(project)))
+    return (terms, project.id)
+
+
+def _search_match(owner_subject: str, grams: Iterable[str]) -> str:
+    return " AND ".join(f'"{term}"' for term in _gram_terms(owner_subject, grams))
+
+
+def _row_to_project(row: tuple[str, str, str, str | None, int]) -> Project:
+    project_id, owner_subject, name, description, created_at_us = row
+    return Project(
+        id=project_id,
+        owner_subject=owner_subject,
+        name=name,
+        description=description,
+        created_at=_from_microseconds(created_at_us),
+    )
+
+
+class SqliteConnectionPool:
+    """Fixed-size pool of WAL-mode connections shareable across worker threads."""
+
+    def __init__(self, path: str | Path, *, size: int) -> None:
+        self._path = str(path)
+        if self._path != ":memory:":
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+        self._connections: LifoQueue[sqlite3.Connection] = LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._connections.put_nowait(self._connect())
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self._path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=64,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MILLISECONDS}")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        try:
+            connection = self._connections.get(timeout=POOL_ACQUIRE_TIMEOUT_SECONDS)
+        except Empty as error:
+            raise RuntimeError("SQLite connection pool is exhausted.") from error
+        try:
+            yield connection
+        finally:
+            self._connections.put_nowait(connection)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._connections.get_nowait().close()
+            except Empty:
+                return
+
+
+class SqliteProjectRepository:
+    def __init__(self, path: str | Path, *, pool_size: int = 4) -> None:
+        self._pool = SqliteConnectionPool(path, size=pool_size)
+        with self._pool.connection() as connection:
+            for statement in SCHEMA_STATEMENTS:
+                connection.execute(statement)
+            self._migrate(connection)
+
+    @staticmethod
+    def _migrate(connection: sqlite3.Connection) -> None:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            (user_version,) = connection.execute("PRAGMA user_version").fetchone()
+            if user_version < 1:
+                # Databases created before search: index the existing projects.
+                projects = [_row_to_project(row) for row in connection.execute(SELECT_ALL_SQL)]
+                connection.executemany(
+                    INSERT_SEARCH_TERMS_SQL,
+                    (_search_terms_row(project) for project in projects),
+                )
+            if user_version < SCHEMA_VERSION:
+                connection.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def get_owner_version(self, owner_subject: str) -> int:
+        with self._pool.connection() as connection:
+            row = connection.execute(SELECT_OWNER_VERSION_SQL, (owner_subject,)).fetchone()
+        return row[0] if row else 0
+
+    def list_page_by_owner(
+        self,
+        owner_subject: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        # One extra row tells whether another page exists.
+        with self._pool.connection() as connection:
+            rows = self._page_cursor(connection, owner_subject, after, limit + 1).fetchall()
+
+        items = [_row_to_project(row) for row in rows[:limit]]
+        next_cursor = ProjectCursor.after(items[-1]) if len(rows) > limit and items else None
+        return ProjectPage(items=items, next_cursor=next_cursor)
+
+    def search_page_by_owner(
+        self,
+        owner_subject: str,
+        normalized_query: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        grams = query_search_grams(normalized_query)
+        with self._pool.connection() as connection:
+            if not grams:
+                # Too short for the trigram index: scan a bounded run of the list.
+                cursor = self._page_cursor(connection, owner_subject, after, SHORT_QUERY_SCAN_LIMIT)
+                items, resume_after = scan_for_matches(
+                    (_row_to_project(row) for row in cursor),
+                    normalized_query,
+                    limit=limit,
+                )
+                cursor.close()
+                next_cursor = ProjectCursor.after(resume_after) if resume_after else None
+                return ProjectPage(items=items, next_cursor=next_cursor)
+
+            match = _search_match(owner_subject, grams)
+            if after is None:
+                cursor = connection.execute(SEARCH_FIRST_PAGE_SQL, (match,))
+            else:
+                cursor = connection.execute(SEARCH_PAGE_AFTER_SQL, (match, after.id))
+            # Rows stream off the index in page order; stop once the page is full.
+            items = []
+            has_more = False
+            for row in cursor:
+                project = _row_to_project(row)
+                if project.owner_subject != owner_subject:
+                    continue
+                if not project_matches_query(project, normalized_query):
+                    continue
+                if len(items) == limit:
+                    has_more = True
+                    break
+                items.append(project)
+            cursor.close()
+
+        next_cursor = ProjectCursor.after(items[-1]) if has_more and items else None
+        return ProjectPage(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def _page_cursor(
+        connection: sqlite3.Connection,
+        owner_subject: str,
+        after: ProjectCursor | None,
+        limit: int,
+    ) -> sqlite3.Cursor:
+        if after is None:
+            return connection.execute(SELECT_FIRST_PAGE_SQL, (owner_subject, limit))
+        return connection.execute(
+            SELECT_PAGE_AFTER_SQL,
+            (owner_subject, _to_microseconds(after.created_at), after.id, limit),
+        )
+
+    def create(
+        self,
+        owner_subject: str,
+        name: str,
+        description: str | None,
+    ) -> Project:
+        return self.create_many(
+            owner_subject,
+            (ProjectDraft(name=name, description=description),),
+        )[0]
+
+    def create_many(
+        self,
+        owner_subject: str,
+        drafts: Sequence[ProjectDraft],
+    ) -> list[Project]:
+        if not drafts:
+            return []
+
+        with self._pool.connection() as connection:
+            # One transaction so other workers never see rows without the new version.
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                # Taken under the write lock and never behind the owner's newest
+                # project, so rowid order matches created_at order for search.
+                created_at_us = _to_microseconds(datetime.now(timezone.utc))
+                latest = connection.execute(
+                    SELECT_LATEST_CREATED_AT_SQL,
+                    (owner_subject,),
+                ).fetchone()
+                if latest is not None:
+                    created_at_us = max(created_at_us, latest[0] + 1)
+                projects = [
+                    Project(
+                        id=str(uuid4()),
+                        owner_subject=owner_subject,
+                        name=draft.name,
+                        description=draft.description,
+                        created_at=_from_microseconds(created_at_us + offset),
+                    )
+                    for offset, draft in enumerate(drafts)
+                ]
+                connection.executemany(
+                    INSERT_SQL,
+                    (
+                        (
+                            project.id,
+                            project.owner_subject,
+                            project.name,
+                            project.description,
+                            _to_microseconds(project.created_at),
+                        )
+                        for project in projects
+                    ),
+                )
+                connection.executemany(
+                    INSERT_SEARCH_TERMS_SQL,
+                    (_search_terms_row(project) for project in projects),
+                )
+                connection.execute(BUMP_OWNER_VERSION_SQL, (owner_subject,))
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return projects
+
+    def start(self) -> None:
+        return None
+
+    def close(self) -> None:
+        self._pool.close()
@@ -0,0 +1,32 @@
+import hashlib
+
+
+def project_list_etag(
+    *,
+    owner_subject: str,
+    version: int,
+    limit: int,
+    cursor: str | None,
+    query: str | None,
+) -> str:
+    # Versions are per owner, so the subject and page parameters go into the tag
+    # to keep equal version numbers of different users or pages apart.
+    scope = hashlib.blake2b(
+        f"{owner_subject}\x00{limit}\x00{cursor or ''}\x00{query or ''}".encode("utf-8"),
+        digest_size=8,
+    ).hexdigest()
+    return f'"{version}-{scope}"'
+
+
+def if_none_match_matches(header_value: str | None, etag: str) -> bool:
+    if not header_value:
+        return False
+    for candidate in header_value.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
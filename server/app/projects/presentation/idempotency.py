@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+
+class IdempotencyKeyReusedError(Exception):
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class StoredResponse:
+    status_code: int
+    body: bytes
+
+
+@dataclass(slots=True)
+class _Entry:
+    request_fingerprint: str
+    # Resolves to the stored response, or None when the first attempt failed
+    # and a waiting duplicate should take over.
+    outcome: asyncio.Future[StoredResponse | None]
+    expires_at: float = field(default=float("inf"))
+
+
+class IdempotencyCache:
+    """Bounded TTL cache of responses keyed by (subject, Idempotency-Key).
+
+    Concurrent duplicates await the in-flight first request instead of
+    running the operation again, so the repository sees one write per
+    logical request.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+
+    async def run(
+        self,
+        subject: str,
+        key: str,
+        request_fingerprint: str,
+        operation: Callable[[], Awaitable[StoredResponse]],
+    ) -> tuple[StoredResponse, bool]:
+        """Returns (response, replayed)."""
+        cache_key = (subject, key)
+        while True:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[cache_key]
+                entry = None
+
+            if entry is None:
+                return await self._run_first(cache_key, request_fingerprint, operation), False
+
+            if entry.request_fingerprint != request_fingerprint:
+                raise IdempotencyKeyReusedError(
+                    "Idempotency-Key was already used with a different request."
+                )
+            stored = await asyncio.shield(entry.outcome)
+            if stored is not None:
+                return stored, True
+
+    async def _run_first(
+        self,
+        cache_key: tuple[str, str],
+        request_fingerprint: str,
+        operation: Callable[[], Awaitable[StoredResponse]],
+    ) -> StoredResponse:
+        entry = _Entry(
+            request_fingerprint=request_fingerprint,
+            outcome=asyncio.get_running_loop().create_future(),
+        )
+        self._entries[cache_key] = entry
+        self._evict_overflow()
+
+        stored: StoredResponse | None = None
+        try:
+            stored = await operation()
+            entry.expires_at = time.monotonic() + self._ttl_seconds
+            return stored
+        finally:
+            if stored is None and self._entries.get(cache_key) is entry:
+                # Failed or cancelled: forget the key so a retry can run it again.
+                del self._entries[cache_key]
+            entry.outcome.set_result(stored)
+
+    def _evict_overflow(self) -> None:
+        now = time.monotonic()
+        overflow = len(self._entries) - self._max_entries
+        evictable: list[tuple[str, str]] = []
+        for cache_key, entry in self._entries.items():
+            if not entry.outcome.done():
+                # Still in flight: dropping it would let a duplicate start a second
+                # write. The cache may briefly exceed max_entries by the requests
+                # in flight.
+                continue
+            if overflow <= 0 and entry.expires_at > now:
+                break
+            evictable.append(cache_key)
+            overflow -= 1
+        for cache_key in evictable:
+            del self._entries[cache_key]
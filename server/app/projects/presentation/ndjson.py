@@ -0,0 +1,60 @@
+from collections.abc import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    *,
+    max_line_bytes: int,
+) -> AsyncIterator[tuple[int, bytes | None]]:
+    """Yields (line number, line) for non-blank lines; None marks an oversized line.
+
+    At most one line (capped at max_line_bytes) is buffered, whatever the body size.
+    """
+    buffer = bytearray()
+    line_number = 0
+    oversized = False
+    async for chunk in chunks:
+        start = 0
+        while True:
+            newline = chunk.find(b"\n", start)
+            if newline == -1:
+                if not oversized:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        oversized = True
+                        buffer.clear()
+                break
+
+            line_number += 1
+            if not oversized:
+                buffer += chunk[start:newline]
+                oversized = len(buffer) > max_line_bytes
+            if oversized:
+                yield line_number, None
+            elif buffer.strip():
+                yield line_number, bytes(buffer)
+            buffer.clear()
+            oversized = False
+            start = newline + 1
+
+    if oversized or buffer.strip():
+        yield line_number + 1, None if oversized else bytes(buffer)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """StreamingResponse whose body iterator may still be reading the request body.
+
+    The stock response polls `receive` for a disconnect on older ASGI servers,
+    which would steal request body chunks; here the request stream itself
+    surfaces the disconnect instead.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
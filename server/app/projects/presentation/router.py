@@ -1,33 +1,137 @@
+import hashlib
+import json
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from pydantic import ValidationError
 
 from app.auth.domain.principal import AuthenticatedPrincipal
-from app.auth.presentation.dependencies import get_current_authorized_principal
-from app.core.dependencies import get_project_service
+from app.auth.presentation.dependencies import require_access_policy
+from app.core.dependencies import (
+    get_idempotency_cache,
+    get_project_json_cache,
+    get_project_service,
+)
+from app.projects.domain.models import ProjectDraft
+from app.projects.presentation.etags import if_none_match_matches, project_list_etag
+from app.projects.presentation.idempotency import (
+    IDEMPOTENCY_KEY_MAX_LENGTH,
+    IdempotencyCache,
+    IdempotencyKeyReusedError,
+    StoredResponse,
+)
+from app.projects.presentation.ndjson import (
+    NDJSON_MEDIA_TYPE,
+    DuplexStreamingResponse,
+    iter_ndjson_lines,
+)
 from app.projects.presentation.schemas import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    MAX_SEARCH_QUERY_LENGTH,
     ProjectCreateRequest,
+    ProjectImportResult,
     ProjectListResponse,
     ProjectResponse,
+    decode_project_cursor,
 )
+from app.projects.presentation.serialization import ProjectJsonCache
 from app.projects.services.project_service import ProjectService
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 CurrentPrincipal = Annotated[
     AuthenticatedPrincipal,
-    Depends(get_current_authorized_principal),
+    Depends(require_access_policy("projects")),
 ]
 ProjectServiceDep = Annotated[ProjectService, Depends(get_project_service)]
+IdempotencyCacheDep = Annotated[IdempotencyCache, Depends(get_idempotency_cache)]
+ProjectJsonCacheDep = Annotated[ProjectJsonCache, Depends(get_project_json_cache)]
 
+JSON_MEDIA_TYPE = "application/json"
+PROJECT_LIST_CACHE_CONTROL = "private, no-cache"
+IDEMPOTENT_REPLAYED_HEADER = "Idempotent-Replayed"
+IMPORT_BATCH_SIZE = 500
+IMPORT_MAX_LINE_BYTES = 16 * 1024
 
-@router.get("", response_model=ProjectListResponse)
+
+@router.get(
+    "",
+    response_model=ProjectListResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Project list unchanged."}},
+)
 async def list_projects(
     current_principal: CurrentPrincipal,
     project_service: ProjectServiceDep,
-) -> ProjectListResponse:
-    projects = project_service.list_for_owner(current_principal.subject)
-    return ProjectListResponse.from_domain(projects)
+    json_cache: ProjectJsonCacheDep,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+    cursor: Annotated[str | None, Query(max_length=512)] = None,
+    q: Annotated[str | None, Query(max_length=MAX_SEARCH_QUERY_LENGTH)] = None,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    try:
+        after = decode_project_cursor(cursor) if cursor else None
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error),
+        ) from error
+
+    # Read the version before the page: a concurrent create can only make the
+    # body newer than its tag, which the next request then re-fetches.
+    version = await project_service.get_list_version(current_principal.subject)
+    etag = project_list_etag(
+        owner_subject=current_principal.subject,
+        version=version,
+        limit=limit,
+        cursor=cursor,
+        query=q,
+    )
+    cache_headers = {"ETag": etag, "Cache-Control": PROJECT_LIST_CACHE_CONTROL}
+    if if_none_match_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    if q:
+        page = await project_service.search_page_for_owner(
+            current_principal.subject,
+            q,
+            limit=limit,
+            after=after,
+        )
+    else:
+        page = await project_service.list_page_for_owner(
+            current_principal.subject,
+            limit=limit,
+            after=after,
+        )
+    # Pre-encoded bytes bypass response_model validation; the model documents the shape.
+    return Response(
+        content=json_cache.page_json(page),
+        media_type=JSON_MEDIA_TYPE,
+        headers=cache_headers,
+    )
+
+
+async def _create_project(
+    project_service: ProjectService,
+    json_cache: ProjectJsonCache,
+    owner_subject: str,
+    payload: ProjectCreateRequest,
+) -> StoredResponse:
+    try:
+        project = await project_service.create_for_owner(
+            owner_subject=owner_subject,
+            name=payload.name,
+            description=payload.description,
+        )
+    except ValueError as error:
+        # Same body as HTTPException, but storable for idempotent replays.
+        return StoredResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            body=json.dumps({"detail": str(error)}).encode("utf-8"),
+        )
+    return StoredResponse(status_code=status.HTTP_200_OK, body=json_cache.project_json(project))
 
 
 @router.post("", response_model=ProjectResponse)
@@ -35,16 +139,123 @@ async def create_project(
     payload: ProjectCreateRequest,
     current_principal: CurrentPrincipal,
     project_service: ProjectServiceDep,
-) -> ProjectResponse:
+    idempotency_cache: IdempotencyCacheDep,
+    json_cache: ProjectJsonCacheDep,
+    idempotency_key: Annotated[
+        str | None,
+        Header(min_length=1, max_length=IDEMPOTENCY_KEY_MAX_LENGTH),
+    ] = None,
+) -> Response:
+    owner_subject = current_principal.subject
+    if idempotency_key is None:
+        stored = await _create_project(project_service, json_cache, owner_subject, payload)
+        return Response(stored.body, stored.status_code, media_type=JSON_MEDIA_TYPE)
+
+    fingerprint = hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest()
     try:
-        project = project_service.create_for_owner(
-            owner_subject=current_principal.subject,
-            name=payload.name,
-            description=payload.description,
+        stored, replayed = await idempotency_cache.run(
+            owner_subject,
+            idempotency_key,
+            fingerprint,
+            lambda: _create_project(project_service, json_cache, owner_subject, payload),
         )
-    except ValueError as error:
+    except IdempotencyKeyReusedError as error:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail=str(error),
         ) from error
-    return ProjectResponse.from_domain(project)
+    return Response(
+        stored.body,
+        stored.status_code,
+        headers={IDEMPOTENT_REPLAYED_HEADER: "true"} if replayed else None,
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    messages = []
+    for detail in error.errors(include_url=False):
+        location = ".".join(str(part) for part in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+    return "; ".join(messages)
+
+
+def _parse_import_line(line: bytes | None) -> ProjectCreateRequest | str:
+    if line is None:
+        return f"Line exceeds {IMPORT_MAX_LINE_BYTES} bytes."
+    try:
+        return ProjectCreateRequest.model_validate_json(line)
+    except ValidationError as error:
+        return _format_validation_error(error)
+
+
+async def _import_batch(
+    project_service: ProjectService,
+    owner_subject: str,
+    rows: list[tuple[int, ProjectCreateRequest | str]],
+) -> bytes:
+    drafts = [
+        ProjectDraft(name=row.name, description=row.description)
+        for _, row in rows
+        if isinstance(row, ProjectCreateRequest)
+    ]
+    try:
+        created = iter(await project_service.create_many_for_owner(owner_subject, drafts))
+        batch_error = None
+    except ValueError as error:
+        created = iter(())
+        batch_error = str(error)
+
+    results = []
+    for line_number, row in rows:
+        if isinstance(row, str):
+            result = ProjectImportResult(line=line_number, status="error", detail=row)
+        elif batch_error is not None:
+            result = ProjectImportResult(line=line_number, status="error", detail=batch_error)
+        else:
+            result = ProjectImportResult(
+                line=line_number,
+                status="created",
+                project=ProjectResponse.from_domain(next(created)),
+            )
+        results.append(result.model_dump_json(exclude_unset=True).encode("utf-8") + b"\n")
+    return b"".join(results)
+
+
+async def _stream_import_results(
+    request: Request,
+    project_service: ProjectService,
+    owner_subject: str,
+) -> AsyncIterator[bytes]:
+    rows: list[tuple[int, ProjectCreateRequest | str]] = []
+    async for line_number, line in iter_ndjson_lines(
+        request.stream(),
+        max_line_bytes=IMPORT_MAX_LINE_BYTES,
+    ):
+        rows.append((line_number, _parse_import_line(line)))
+        if len(rows) >= IMPORT_BATCH_SIZE:
+            yield await _import_batch(project_service, owner_subject, rows)
+            rows = []
+    if rows:
+        yield await _import_batch(project_service, owner_subject, rows)
+
+
+@router.post(
+    "/import",
+    response_class=DuplexStreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {NDJSON_MEDIA_TYPE: {}},
+            "description": "One ProjectImportResult JSON object per input line.",
+        },
+    },
+)
+async def import_projects(
+    request: Request,
+    current_principal: CurrentPrincipal,
+    project_service: ProjectServiceDep,
+) -> DuplexStreamingResponse:
+    return DuplexStreamingResponse(
+        _stream_import_results(request, project_service, current_principal.subject),
+        media_type=NDJSON_MEDIA_TYPE,
+    )
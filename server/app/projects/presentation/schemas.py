@@ -1,8 +1,15 @@
+import base64
+import binascii
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from app.projects.domain.models import Project
+from app.projects.domain.models import Project, ProjectCursor
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+MAX_SEARCH_QUERY_LENGTH = 100
 
 
 class ProjectCreateRequest(BaseModel):
@@ -35,10 +42,34 @@ class ProjectResponse(BaseModel):
         )
 
 
+def encode_project_cursor(cursor: ProjectCursor) -> str:
+    raw = f"{cursor.created_at.isoformat()}|{cursor.id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_project_cursor(value: str) -> ProjectCursor:
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        created_at, separator, project_id = raw.partition("|")
+        if not separator or not project_id:
+            raise ValueError
+        parsed_created_at = datetime.fromisoformat(created_at)
+        if parsed_created_at.tzinfo is None:
+            raise ValueError
+        return ProjectCursor(created_at=parsed_created_at, id=project_id)
+    except (ValueError, UnicodeError, binascii.Error) as error:
+        raise ValueError("Invalid project list cursor.") from error
+
+
+class ProjectImportResult(BaseModel):
+    line: int
+    status: Literal["created", "error"]
+    project: ProjectResponse | None = None
+    detail: str | None = None
+
+
 class ProjectListResponse(BaseModel):
     items: list[ProjectResponse]
-
-    @classmethod
-    def from_domain(cls, projects: list[Project]) -> "ProjectListResponse":
-        return cls(items=[ProjectResponse.from_domain(project) for project in projects])
+    next_cursor: str | None = None
 
@@ -0,0 +1,43 @@
+import json
+from collections import OrderedDict
+
+from app.projects.domain.models import Project, ProjectPage
+from app.projects.presentation.schemas import ProjectResponse, encode_project_cursor
+
+
+class ProjectJsonCache:
+    """Bounded LRU of ProjectResponse JSON bytes keyed by project id.
+
+    Projects never change after creation, so an id always encodes to the same
+    bytes. Only touched from the event loop, so no lock is needed.
+    """
+
+    def __init__(self, *, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._encoded: OrderedDict[str, bytes] = OrderedDict()
+
+    def project_json(self, project: Project) -> bytes:
+        encoded = self._encoded.get(project.id)
+        if encoded is not None:
+            self._encoded.move_to_end(project.id)
+            return encoded
+
+        encoded = ProjectResponse.from_domain(project).model_dump_json().encode("utf-8")
+        if self._max_entries:
+            self._encoded[project.id] = encoded
+            if len(self._encoded) > self._max_entries:
+                self._encoded.popitem(last=False)
+        return encoded
+
+    def page_json(self, page: ProjectPage) -> bytes:
+        """ProjectListResponse JSON assembled from each project's cached encoding."""
+        next_cursor = encode_project_cursor(page.next_cursor) if page.next_cursor else None
+        return b"".join(
+            (
+                b'{"items":[',
+                b",".join([self.project_json(project) for project in page.items]),
+                b'],"next_cursor":',
+                json.dumps(next_cursor).encode("ascii"),
+                b"}",
+            )
+        )
@@ -1,30 +1,71 @@
-from app.projects.domain.models import Project
-from app.projects.domain.repositories import ProjectRepository
+from collections.abc import Sequence
+
+from app.projects.domain.models import Project, ProjectCursor, ProjectDraft, ProjectPage
+from app.projects.domain.repositories import AsyncProjectRepository
+from app.projects.domain.search import normalize_search_text
 
 
 class ProjectService:
-    def __init__(self, repository: ProjectRepository) -> None:
+    def __init__(self, repository: AsyncProjectRepository) -> None:
         self._repository = repository
 
-    def list_for_owner(self, owner_subject: str) -> list[Project]:
-        return self._repository.list_by_owner(owner_subject)
+    async def get_list_version(self, owner_subject: str) -> int:
+        return await self._repository.get_owner_version(owner_subject)
 
-    def create_for_owner(
+    async def list_page_for_owner(
+        self,
+        owner_subject: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        return await self._repository.list_page_by_owner(owner_subject, limit=limit, after=after)
+
+    async def search_page_for_owner(
+        self,
+        owner_subject: str,
+        query: str,
+        *,
+        limit: int,
+        after: ProjectCursor | None = None,
+    ) -> ProjectPage:
+        normalized_query = normalize_search_text(query.strip())
+        if not normalized_query:
+            return await self.list_page_for_owner(owner_subject, limit=limit, after=after)
+        return await self._repository.search_page_by_owner(
+            owner_subject,
+            normalized_query,
+            limit=limit,
+            after=after,
+        )
+
+    async def create_for_owner(
         self,
         owner_subject: str,
         name: str,
         description: str | None,
     ) -> Project:
+        draft = self._clean_draft(name, description)
+        return await self._repository.create(
+            owner_subject=owner_subject,
+            name=draft.name,
+            description=draft.description,
+        )
+
+    async def create_many_for_owner(
+        self,
+        owner_subject: str,
+        drafts: Sequence[ProjectDraft],
+    ) -> list[Project]:
+        cleaned_drafts = [self._clean_draft(draft.name, draft.description) for draft in drafts]
+        return await self._repository.create_many(owner_subject, cleaned_drafts)
+
+    @staticmethod
+    def _clean_draft(name: str, description: str | None) -> ProjectDraft:
         cleaned_name = name.strip()
         cleaned_description = description.strip() if isinstance(description, str) else None
         if not cleaned_name:
             raise ValueError("Project name is required.")
         if cleaned_description == "":
             cleaned_description = None
-
-        return self._repository.create(
-            owner_subject=owner_subject,
-            name=cleaned_name,
-            description=cleaned_description,
-        )
-
+        return ProjectDraft(name=cleaned_name, description=cleaned_description)
@@ -0,0 +1 @@
+"""Local performance benchmarks (run with `uv run python -m benchmarks.<name>`)."""
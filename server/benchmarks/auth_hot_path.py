@@ -0,0 +1,279 @@
+"""Throughput, latency and allocation benchmark for the auth hot path.
+
+Drives KeycloakTokenVerifier and the FastAPI auth dependencies against an
+in-process Keycloak stub with valid, cached, expired, unknown-kid and
+rotated-key tokens.
+
+    uv run python -m benchmarks.auth_hot_path
+    uv run python -m benchmarks.auth_hot_path --baseline benchmarks/auth_hot_path_baseline.json
+    uv run python -m benchmarks.auth_hot_path --write-baseline benchmarks/auth_hot_path_baseline.json
+
+The gate compares each scenario's throughput divided by the speed of a fixed
+pure-Python calibration loop timed in the same run, so a baseline recorded on
+one machine can gate a run on another. Both are the best of several passes to
+ride out noisy hosts. With --baseline the script exits non-zero when any
+scenario's relative throughput falls more than --tolerance below the recorded
+value; the default is coarse on purpose and catches regressions such as a
+bypassed token cache or per-request key parsing, not a few percent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import sys
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from app.auth.domain.access_policy import AccessPolicy
+from app.auth.domain.exceptions import AuthError
+from app.auth.infrastructure.keycloak_token_verifier import KeycloakTokenVerifier
+from app.auth.presentation.dependencies import get_current_principal, require_access_policy
+from app.auth.services.auth_service import AuthService
+from benchmarks.keycloak_stub import KeycloakStub, build_verifier
+
+Operation = Callable[[str], Awaitable[object]]
+
+CALIBRATION_SAMPLES = 5
+CALIBRATION_SAMPLE_SECONDS = 0.1
+
+
+@dataclass(slots=True, frozen=True)
+class ScenarioResult:
+    name: str
+    operations: int
+    ops_per_second: float
+    p50_us: float
+    p99_us: float
+    peak_alloc_bytes_per_op: float
+
+
+async def _swallow_auth_errors(operation: Operation, token: str) -> None:
+    try:
+        await operation(token)
+    except AuthError:
+        pass
+    except Exception as error:  # HTTPException from the FastAPI dependencies
+        if getattr(error, "status_code", None) not in {401, 403}:
+            raise
+
+
+async def run_scenario(
+    name: str,
+    operation: Operation,
+    tokens: list[str],
+    *,
+    allocation_samples: int,
+    repeats: int,
+) -> ScenarioResult:
+    # The fastest of several timed passes, so one noisy pass cannot trip the gate.
+    best: tuple[float, list[float]] | None = None
+    for _ in range(repeats):
+        latencies: list[float] = []
+        started_at = perf_counter()
+        for token in tokens:
+            op_started_at = perf_counter()
+            await _swallow_auth_errors(operation, token)
+            latencies.append(perf_counter() - op_started_at)
+        elapsed = perf_counter() - started_at
+        if best is None or elapsed < best[0]:
+            best = (elapsed, latencies)
+    elapsed, latencies = best
+
+    # Separate pass: tracemalloc slows everything down, so keep it out of timings.
+    peaks: list[int] = []
+    tracemalloc.start()
+    try:
+        for token in tokens[:allocation_samples]:
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await _swallow_auth_errors(operation, token)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    percentiles = quantiles(latencies, n=100)
+    return ScenarioResult(
+        name=name,
+        operations=len(tokens),
+        ops_per_second=len(tokens) / elapsed,
+        p50_us=percentiles[49] * 1_000_000,
+        p99_us=percentiles[98] * 1_000_000,
+        peak_alloc_bytes_per_op=sum(peaks) / max(1, len(peaks)),
+    )
+
+
+def _dependency_operation(auth_service: AuthService) -> Operation:
+    # The same dependency chain the projects router resolves per request.
+    authorize_projects = require_access_policy("projects")
+
+    async def operation(token: str) -> object:
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        principal = await get_current_principal(credentials, auth_service)
+        return await authorize_projects(principal, auth_service)
+
+    return operation
+
+
+async def run_suite(
+    *,
+    operations: int,
+    allocation_samples: int,
+    repeats: int,
+) -> list[ScenarioResult]:
+    stub = KeycloakStub()
+    cached_verifier = build_verifier(stub)
+    uncached_verifier = build_verifier(
+        stub,
+        token_cache_max_entries=0,
+        jwks_min_forced_refresh_interval_seconds=0,
+    )
+    auth_service = AuthService(
+        token_verifier=cached_verifier,
+        access_policies={
+            "default": AccessPolicy("role:active"),
+            "projects": AccessPolicy("role:active && group:/team/*"),
+        },
+    )
+    verifiers: tuple[KeycloakTokenVerifier, ...] = (cached_verifier, uncached_verifier)
+    for verifier in verifiers:
+        await verifier.start()
+
+    try:
+        valid_token = stub.issue_token()
+        fresh_tokens = [stub.issue_token() for _ in range(operations)]
+        expired_tokens = [stub.issue_token(expires_in=-60) for _ in range(operations)]
+        unknown_kid_tokens = [stub.issue_token(key_id="unknown-kid") for _ in range(operations)]
+        rotated_key = stub.rotate()
+        rotated_tokens = [stub.issue_token(key=rotated_key) for _ in range(operations)]
+        mixed_tokens = random.Random(7).choices(
+            [valid_token, *fresh_tokens[:50], *expired_tokens[:10], *unknown_kid_tokens[:5]],
+            weights=[80, *[0.3] * 50, *[0.4] * 10, *[0.4] * 5],
+            k=operations,
+        )
+
+        scenarios: list[tuple[str, Operation, list[str]]] = [
+            ("verifier/valid-cached", cached_verifier.verify_access_token, [valid_token] * operations),
+            ("verifier/valid-uncached", uncached_verifier.verify_access_token, fresh_tokens),
+            ("verifier/expired", uncached_verifier.verify_access_token, expired_tokens),
+            ("verifier/unknown-kid", uncached_verifier.verify_access_token, unknown_kid_tokens),
+            ("verifier/rotated-key", uncached_verifier.verify_access_token, rotated_tokens),
+            ("verifier/mixed", cached_verifier.verify_access_token, mixed_tokens),
+            ("dependency/projects-policy", _dependency_operation(auth_service), mixed_tokens),
+        ]
+        return [
+            await run_scenario(
+                name,
+                operation,
+                tokens,
+                allocation_samples=allocation_samples,
+                repeats=repeats,
+            )
+            for name, operation, tokens in scenarios
+        ]
+    finally:
+        for verifier in verifiers:
+            await verifier.close()
+
+
+def measure_calibration() -> float:
+    """Best iterations per second of a fixed JSON + SHA-256 loop, as a machine speed reference."""
+    payload = {"sub": "calibration", "roles": ["active", "member"], "exp": 1_700_000_000}
+    best = 0.0
+    for _ in range(CALIBRATION_SAMPLES):
+        iterations = 0
+        started_at = perf_counter()
+        deadline = started_at + CALIBRATION_SAMPLE_SECONDS
+        while perf_counter() < deadline:
+            for _ in range(100):
+                encoded = json.dumps(payload, separators=(",", ":")).encode()
+                json.loads(encoded)
+                hashlib.sha256(encoded).digest()
+            iterations += 100
+        best = max(best, iterations / (perf_counter() - started_at))
+    return best
+
+
+def find_regressions(
+    results: list[ScenarioResult],
+    calibration: float,
+    baseline: dict,
+    *,
+    tolerance: float,
+) -> list[str]:
+    regressions: list[str] = []
+    recorded_calibration = baseline["calibration_ops_per_second"]
+    for result in results:
+        recorded = baseline["scenarios"].get(result.name)
+        if recorded is None:
+            continue
+        relative = result.ops_per_second / calibration
+        floor = recorded["ops_per_second"] / recorded_calibration * (1.0 - tolerance)
+        if relative < floor:
+            regressions.append(
+                f"{result.name}: {relative:.4f} x calibration < {floor:.4f} "
+                f"({result.ops_per_second:,.0f} ops/s at {calibration:,.0f} iterations/s)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--allocation-samples", type=int, default=200)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--write-baseline", type=Path)
+    parser.add_argument("--repeats", type=int, default=3, help="timed passes per scenario")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args()
+
+    calibration_before = measure_calibration()
+    results = asyncio.run(
+        run_suite(
+            operations=args.operations,
+            allocation_samples=args.allocation_samples,
+            repeats=args.repeats,
+        )
+    )
+    calibration = max(calibration_before, measure_calibration())
+    print(f"calibration: {calibration:,.0f} iterations/s\n")
+    print(
+        f"{'scenario':<34}{'ops/s':>12}{'x calib':>10}"
+        f"{'p50 us':>10}{'p99 us':>10}{'peak B/op':>12}"
+    )
+    for result in results:
+        print(
+            f"{result.name:<34}{result.ops_per_second:>12,.0f}"
+            f"{result.ops_per_second / calibration:>10.4f}"
+            f"{result.p50_us:>10.1f}{result.p99_us:>10.1f}"
+            f"{result.peak_alloc_bytes_per_op:>12,.0f}"
+        )
+
+    if args.write_baseline:
+        baseline = {
+            "calibration_ops_per_second": calibration,
+            "scenarios": {result.name: asdict(result) for result in results},
+        }
+        args.write_baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = find_regressions(results, calibration, baseline, tolerance=args.tolerance)
+        if regressions:
+            print("\nThroughput regressions:", *regressions, sep="\n  ", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
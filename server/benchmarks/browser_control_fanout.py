@@ -0,0 +1,197 @@
+"""Cross-worker fan-out latency and throughput of browser control event brokers.
+
+Starts 1..N worker processes, each running a BrowserControlEventService with
+--subscribers queues for the same owner. Worker 0 publishes --events actions;
+every worker records how long each event took to reach each of its
+subscribers. One worker is measured with both the in-process broker and the
+Unix socket hub; more workers need the hub.
+
+    uv run python -m benchmarks.browser_control_fanout
+    uv run python -m benchmarks.browser_control_fanout --workers 1 2 4 8 --subscribers 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import tempfile
+from datetime import datetime, UTC
+from multiprocessing.synchronize import Barrier
+from pathlib import Path
+from time import perf_counter
+
+from app.browser_control.domain.brokers import BrowserControlEventBroker
+from app.browser_control.infrastructure.in_process_event_broker import InProcessEventBroker
+from app.browser_control.infrastructure.unix_socket_event_broker import UnixSocketEventBroker
+from app.browser_control.services.browser_control_event_service import (
+    BrowserControlEventService,
+    StreamSignal,
+)
+from app.browser_control.services.event_replay_buffer import EventReplayBuffer
+
+OWNER_SUBJECT = "benchmark-owner"
+IDLE_TIMEOUT_SECONDS = 5.0
+
+
+async def _consume(queue: asyncio.Queue, events: int, latencies: list[float]) -> None:
+    received = 0
+    while received < events:
+        try:
+            event = await asyncio.wait_for(queue.get(), timeout=IDLE_TIMEOUT_SECONDS)
+        except TimeoutError:
+            return
+        if event is StreamSignal.KEEPALIVE:
+            continue
+        received += 1
+        latencies.append((datetime.now(UTC) - event.created_at).total_seconds())
+
+
+async def _run_worker(
+    index: int,
+    broker: BrowserControlEventBroker,
+    *,
+    events: int,
+    subscribers: int,
+    batch: int,
+    barrier: Barrier | None,
+) -> tuple[list[float], float]:
+    service = BrowserControlEventService(
+        broker=broker,
+        replay_buffer=EventReplayBuffer(
+            events_per_owner=100,
+            max_events=100_000,
+            max_age_seconds=60.0,
+        ),
+        keepalive_interval_seconds=20.0,
+        queue_max_size=100,
+        backpressure_policy="drop_oldest",
+    )
+    await service.start()
+    queues = [(await service.subscribe(OWNER_SUBJECT))[0] for _ in range(subscribers)]
+    latencies: list[float] = []
+    consumers = [asyncio.create_task(_consume(queue, events, latencies)) for queue in queues]
+    if barrier is not None:
+        await asyncio.to_thread(barrier.wait)
+
+    started_at = perf_counter()
+    if index == 0:
+        for sequence in range(events):
+            await service.publish_action(OWNER_SUBJECT, action="click", actor="benchmark")
+            if sequence % batch == batch - 1:
+                # Give consumers (and the socket) a turn so queues do not overflow.
+                await asyncio.sleep(0)
+    await asyncio.gather(*consumers)
+    elapsed = perf_counter() - started_at
+
+    if barrier is not None:
+        # Keep the hub up until every worker has drained.
+        await asyncio.to_thread(barrier.wait)
+    await service.close()
+    return latencies, elapsed
+
+
+def _worker_process(
+    index: int,
+    socket_path: str,
+    events: int,
+    subscribers: int,
+    batch: int,
+    barrier: Barrier,
+    results: multiprocessing.Queue,
+) -> None:
+    broker = UnixSocketEventBroker(socket_path, max_peer_buffer_bytes=16 * 1024 * 1024)
+    results.put(
+        asyncio.run(
+            _run_worker(
+                index,
+                broker,
+                events=events,
+                subscribers=subscribers,
+                batch=batch,
+                barrier=barrier,
+            )
+        )
+    )
+
+
+def _run_unix_socket(workers: int, args: argparse.Namespace) -> list[tuple[list[float], float]]:
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = str(Path(directory) / "broker.sock")
+        processes = [
+            context.Process(
+                target=_worker_process,
+                args=(
+                    index,
+                    socket_path,
+                    args.events,
+                    args.subscribers,
+                    args.batch,
+                    barrier,
+                    results,
+                ),
+            )
+            for index in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        outcomes = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+    return outcomes
+
+
+def _report(
+    name: str,
+    workers: int,
+    outcomes: list[tuple[list[float], float]],
+    expected: int,
+) -> None:
+    latencies = sorted(latency for worker_latencies, _ in outcomes for latency in worker_latencies)
+    elapsed = max(worker_elapsed for _, worker_elapsed in outcomes)
+    p50 = statistics.median(latencies) * 1000 if latencies else float("nan")
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else float("nan")
+    print(
+        f"{name:<14}{workers:>8}{len(latencies) / expected:>11.1%}"
+        f"{len(latencies) / elapsed:>16,.0f}{p50:>10.2f}{p99:>10.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--subscribers", type=int, default=4, help="SSE streams per worker")
+    parser.add_argument("--events", type=int, default=5_000)
+    parser.add_argument("--batch", type=int, default=20, help="publishes between yields")
+    args = parser.parse_args()
+
+    print(
+        f"{'broker':<14}{'workers':>8}{'delivered':>11}"
+        f"{'deliveries/s':>16}{'p50 ms':>10}{'p99 ms':>10}"
+    )
+    outcome = asyncio.run(
+        _run_worker(
+            0,
+            InProcessEventBroker(),
+            events=args.events,
+            subscribers=args.subscribers,
+            batch=args.batch,
+            barrier=None,
+        )
+    )
+    _report("in_process", 1, [outcome], args.events * args.subscribers)
+    for workers in args.workers:
+        _report(
+            "unix_socket",
+            workers,
+            _run_unix_socket(workers, args),
+            args.events * args.subscribers * workers,
+        )
+
+
+if __name__ == "__main__":
+    main()
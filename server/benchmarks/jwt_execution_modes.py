@@ -0,0 +1,149 @@
+"""p50/p99 time-to-first-frame of GET /api/browser-control/events under an auth burst.
+
+Every request carries a distinct token (the verified-token cache is disabled), so
+each one pays a full RS256 verification in the configured execution mode. The
+"loop lag" column is how late a 1ms ticker wakes up during the burst, i.e. how long
+keepalives and streamed output of other connections would be held back.
+
+    uv run python -m benchmarks.jwt_execution_modes --requests 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+
+from fastapi import FastAPI
+
+from app.auth.dependencies import get_auth_service
+from app.auth.domain.access_policy import AccessPolicy
+from app.auth.infrastructure.jwt_decode_executor import JwtExecutionMode
+from app.auth.services.auth_service import AuthService
+from app.browser_control.presentation.router import router as browser_control_router
+from benchmarks.keycloak_stub import KeycloakStub, build_verifier
+
+EXECUTION_MODES: tuple[JwtExecutionMode, ...] = ("inline", "thread", "process")
+
+
+def build_app(auth_service: AuthService) -> FastAPI:
+    app = FastAPI()
+    app.include_router(browser_control_router, prefix="/api")
+    app.dependency_overrides[get_auth_service] = lambda: auth_service
+    return app
+
+
+async def time_to_first_frame(app: FastAPI, token: str) -> float:
+    first_frame = asyncio.Event()
+    status: list[int] = []
+
+    async def receive() -> dict:
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+        elif message["type"] == "http.response.body":
+            first_frame.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/browser-control/events",
+        "raw_path": b"/api/browser-control/events",
+        "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 8000),
+    }
+    started_at = perf_counter()
+    task = asyncio.create_task(app(scope, receive, send))
+    await first_frame.wait()
+    elapsed = perf_counter() - started_at
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    if status != [200]:
+        raise RuntimeError(f"Unexpected response status: {status}")
+    return elapsed
+
+
+async def measure_loop_lag(samples: list[float], stop: asyncio.Event) -> None:
+    interval = 0.001
+    while not stop.is_set():
+        started_at = perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(perf_counter() - started_at - interval)
+
+
+async def run_mode(
+    mode: JwtExecutionMode,
+    stub: KeycloakStub,
+    *,
+    requests: int,
+    workers: int,
+) -> tuple[list[float], list[float]]:
+    verifier = build_verifier(
+        stub,
+        token_cache_max_entries=0,
+        jwt_execution_mode=mode,
+        jwt_executor_max_workers=workers,
+        jwt_executor_max_pending=requests,
+    )
+    auth_service = AuthService(
+        token_verifier=verifier,
+        access_policies={"default": AccessPolicy("role:active")},
+    )
+    app = build_app(auth_service)
+    try:
+        # Warm JWKS and executor workers so the burst measures verification only.
+        await asyncio.gather(
+            *(time_to_first_frame(app, stub.issue_token()) for _ in range(workers))
+        )
+        tokens = [stub.issue_token() for _ in range(requests)]
+        lag_samples: list[float] = []
+        stop = asyncio.Event()
+        lag_probe = asyncio.create_task(measure_loop_lag(lag_samples, stop))
+        latencies = await asyncio.gather(
+            *(time_to_first_frame(app, token) for token in tokens)
+        )
+        stop.set()
+        await lag_probe
+        return latencies, lag_samples
+    finally:
+        await auth_service.close()
+
+
+def summarize(mode: str, latencies: list[float], lag_samples: list[float]) -> str:
+    percentiles = quantiles(latencies, n=100)
+    return (
+        f"{mode:>8}  n={len(latencies):<6} "
+        f"p50={percentiles[49] * 1000:8.2f}ms  p99={percentiles[98] * 1000:8.2f}ms  "
+        f"loop lag max={max(lag_samples, default=0.0) * 1000:8.2f}ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--modes", nargs="*", choices=EXECUTION_MODES, default=EXECUTION_MODES)
+    args = parser.parse_args()
+
+    stub = KeycloakStub()
+    for mode in args.modes:
+        latencies, lag_samples = await run_mode(
+            mode,
+            stub,
+            requests=args.requests,
+            workers=args.workers,
+        )
+        print(summarize(mode, latencies, lag_samples))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
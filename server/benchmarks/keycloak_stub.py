@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import time
+from typing import Any
+from uuid import uuid4
+
+import httpx
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+from jose.backends.base import Key
+
+from app.auth.infrastructure.keycloak_token_verifier import KeycloakTokenVerifier
+
+ISSUER = "http://keycloak.local/realms/bench"
+OIDC_CONFIG_URL = f"{ISSUER}/.well-known/openid-configuration"
+JWKS_URI = f"{ISSUER}/protocol/openid-connect/certs"
+CLIENT_ID = "extension-client"
+
+
+@dataclass(slots=True)
+class SigningKey:
+    key_id: str
+    private_pem: bytes
+    public_jwk: dict[str, Any]
+    # Parsed once; handing jwt.encode the PEM made it reparse the key for every token.
+    private_key: Key
+
+    @classmethod
+    def generate(cls, key_id: str | None = None) -> SigningKey:
+        key_id = key_id or uuid4().hex
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        private_pem = private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        public_pem = private_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        public_jwk = {
+            name: value.decode() if isinstance(value, bytes) else value
+            for name, value in jwk.construct(public_pem, "RS256").to_dict().items()
+        }
+        public_jwk.update({"kid": key_id, "use": "sig"})
+        return cls(
+            key_id=key_id,
+            private_pem=private_pem,
+            public_jwk=public_jwk,
+            private_key=jwk.construct(private_pem, "RS256"),
+        )
+
+
+@dataclass(slots=True)
+class KeycloakStub:
+    """In-process OIDC discovery + JWKS endpoint served through httpx.MockTransport."""
+
+    signing_keys: list[SigningKey] = field(default_factory=lambda: [SigningKey.generate()])
+    jwks_requests: int = 0
+    oidc_requests: int = 0
+
+    @property
+    def active_key(self) -> SigningKey:
+        return self.signing_keys[-1]
+
+    def rotate(self) -> SigningKey:
+        key = SigningKey.generate()
+        self.signing_keys.append(key)
+        return key
+
+    def issue_token(
+        self,
+        *,
+        subject: str | None = None,
+        key: SigningKey | None = None,
+        key_id: str | None = None,
+        expires_in: int = 300,
+        roles: list[str] | None = None,
+    ) -> str:
+        key = key or self.active_key
+        now = int(time())
+        claims = {
+            "sub": subject or uuid4().hex,
+            "iss": ISSUER,
+            "aud": CLIENT_ID,
+            "azp": CLIENT_ID,
+            "iat": now,
+            "exp": now + expires_in,
+            "preferred_username": "bench-user",
+            "resource_access": {CLIENT_ID: {"roles": roles or ["active"]}},
+            "groups": ["/team/bench"],
+        }
+        return jwt.encode(
+            claims,
+            key.private_key,
+            algorithm="RS256",
+            headers={"kid": key_id or key.key_id},
+        )
+
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if url == OIDC_CONFIG_URL:
+            self.oidc_requests += 1
+            return httpx.Response(200, json={"issuer": ISSUER, "jwks_uri": JWKS_URI})
+        if url == JWKS_URI:
+            self.jwks_requests += 1
+            return httpx.Response(
+                200,
+                json={"keys": [key.public_jwk for key in self.signing_keys]},
+            )
+        return httpx.Response(404)
+
+    def http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handle))
+
+
+def build_verifier(stub: KeycloakStub, **overrides: Any) -> KeycloakTokenVerifier:
+    options: dict[str, Any] = {
+        "issuer": ISSUER,
+        "audience": CLIENT_ID,
+        "oidc_config_url": OIDC_CONFIG_URL,
+        "verify_ssl": False,
+        "http_client": stub.http_client(),
+    }
+    options.update(overrides)
+    return KeycloakTokenVerifier(**options)
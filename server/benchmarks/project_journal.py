@@ -0,0 +1,82 @@
+"""Write throughput and startup time of the journaled in-memory project store.
+
+For each store size, writes that many projects (spread over --owners owners)
+through InMemoryProjectRepository with and without a ProjectJournal, then
+measures how long a restart takes when it replays the whole log tail and when
+it maps a compacted snapshot.
+
+    uv run python -m benchmarks.project_journal
+    uv run python -m benchmarks.project_journal --sizes 10000 100000 --owners 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from time import perf_counter
+
+from app.projects.infrastructure.in_memory_project_repository import InMemoryProjectRepository
+from app.projects.infrastructure.project_journal import ProjectJournal
+
+
+def _journal(directory: str, *, fsync_interval_seconds: float) -> ProjectJournal:
+    return ProjectJournal(
+        directory,
+        fsync_interval_seconds=fsync_interval_seconds,
+        # Compaction is triggered explicitly below.
+        compact_interval_seconds=3600.0,
+        compact_min_records=1,
+    )
+
+
+def _write(repository: InMemoryProjectRepository, size: int, owners: int) -> float:
+    started_at = perf_counter()
+    for index in range(size):
+        repository.create(f"owner-{index % owners}", f"project {index}", "benchmark project")
+    return size / (perf_counter() - started_at)
+
+
+def _restart(directory: str) -> tuple[InMemoryProjectRepository, ProjectJournal, float]:
+    journal = _journal(directory, fsync_interval_seconds=0.05)
+    started_at = perf_counter()
+    repository = InMemoryProjectRepository(journal=journal)
+    return repository, journal, perf_counter() - started_at
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 100_000])
+    parser.add_argument("--owners", type=int, default=50)
+    parser.add_argument("--fsync-interval-ms", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'projects':>10}{'memory w/s':>14}{'journal w/s':>14}"
+        f"{'replay start s':>16}{'snapshot start s':>18}"
+    )
+    for size in args.sizes:
+        memory_rate = _write(InMemoryProjectRepository(), size, args.owners)
+
+        with tempfile.TemporaryDirectory() as directory:
+            repository = InMemoryProjectRepository(
+                journal=_journal(directory, fsync_interval_seconds=args.fsync_interval_ms / 1000)
+            )
+            repository.start()
+            journal_rate = _write(repository, size, args.owners)
+            repository.close()
+
+            repository, journal, replay_seconds = _restart(directory)
+            journal.compact()
+            repository.close()
+
+            repository, _, snapshot_seconds = _restart(directory)
+            repository.close()
+
+        print(
+            f"{size:>10,}{memory_rate:>14,.0f}{journal_rate:>14,.0f}"
+            f"{replay_seconds:>16.2f}{snapshot_seconds:>18.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Before/after benchmark for the pre-serialized project list response.
+
+Seeds one owner with --projects projects and walks the whole list page by page
+through the ASGI app, once via the previous response_model path (build
+ProjectListResponse, let FastAPI validate and serialize it) and once via the
+real GET /api/projects, which joins each project's cached JSON bytes.
+
+    uv run python -m benchmarks.project_list_serialization
+    uv run python -m benchmarks.project_list_serialization --projects 10000 --page-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import typing
+from statistics import median
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI, Query
+
+from app.auth.domain.principal import AuthenticatedPrincipal
+from app.core.dependencies import get_project_service
+from app.projects.domain.models import ProjectDraft
+from app.projects.infrastructure.in_memory_project_repository import InMemoryProjectRepository
+from app.projects.infrastructure.offloading_project_repository import (
+    OffloadingProjectRepository,
+)
+from app.projects.presentation.router import CurrentPrincipal, router
+from app.projects.presentation.schemas import (
+    MAX_PAGE_SIZE,
+    ProjectListResponse,
+    ProjectResponse,
+    decode_project_cursor,
+    encode_project_cursor,
+)
+from app.projects.services.project_service import ProjectService
+
+OWNER_SUBJECT = "benchmark-owner"
+
+
+def build_app(project_service: ProjectService) -> FastAPI:
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+
+    @app.get("/before/projects", response_model=ProjectListResponse)
+    async def list_projects_before(
+        limit: typing.Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)],
+        cursor: str | None = None,
+    ) -> ProjectListResponse:
+        page = await project_service.list_page_for_owner(
+            OWNER_SUBJECT,
+            limit=limit,
+            after=decode_project_cursor(cursor) if cursor else None,
+        )
+        next_cursor = page.next_cursor
+        return ProjectListResponse(
+            items=[ProjectResponse.from_domain(project) for project in page.items],
+            next_cursor=encode_project_cursor(next_cursor) if next_cursor else None,
+        )
+
+    principal = AuthenticatedPrincipal(
+        subject=OWNER_SUBJECT,
+        username=None,
+        groups=frozenset(),
+        roles=frozenset({"active"}),
+        active_claim=None,
+    )
+    principal_dependency = typing.get_args(CurrentPrincipal)[1].dependency
+    app.dependency_overrides[principal_dependency] = lambda: principal
+    app.dependency_overrides[get_project_service] = lambda: project_service
+    return app
+
+
+async def walk_all_pages(client: httpx.AsyncClient, path: str, page_size: int) -> int:
+    cursor: str | None = None
+    received = 0
+    while True:
+        params: dict[str, str | int] = {"limit": page_size}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(path, params=params)
+        response.raise_for_status()
+        payload = response.json()
+        received += len(payload["items"])
+        cursor = payload["next_cursor"]
+        if cursor is None:
+            return received
+
+
+async def run(*, projects: int, page_size: int, rounds: int) -> None:
+    project_service = ProjectService(
+        OffloadingProjectRepository(
+            InMemoryProjectRepository(),
+            max_workers=4,
+            slow_call_seconds=1.0,
+        )
+    )
+    await project_service.create_many_for_owner(
+        OWNER_SUBJECT,
+        [ProjectDraft(name=f"project-{index}", description="bench") for index in range(projects)],
+    )
+    app = build_app(project_service)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"projects={projects} page_size={page_size} rounds={rounds}")
+        print(f"{'path':<28}{'first walk ms':>15}{'median walk ms':>16}{'per page ms':>13}")
+        pages = -(-projects // page_size)
+        for name, path in (
+            ("before (response_model)", "/before/projects"),
+            ("after (cached bytes)", "/api/projects"),
+        ):
+            timings: list[float] = []
+            for _ in range(rounds + 1):
+                started_at = perf_counter()
+                received = await walk_all_pages(client, path, page_size)
+                timings.append(perf_counter() - started_at)
+                assert received == projects, received
+            # The first walk of the real endpoint also fills the per-project cache.
+            first, steady = timings[0], median(timings[1:])
+            print(
+                f"{name:<28}{first * 1000:>15.1f}{steady * 1000:>16.1f}"
+                f"{steady * 1000 / pages:>13.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=MAX_PAGE_SIZE)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(projects=args.projects, page_size=args.page_size, rounds=args.rounds))
+
+
+if __name__ == "__main__":
+    main()
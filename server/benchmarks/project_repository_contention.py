@@ -0,0 +1,160 @@
+"""Read/write contention benchmark for InMemoryProjectRepository.
+
+Runs reader and writer threads against a shared repository and compares the
+copy-on-write, lock-striped repository with the previous single-lock design
+(reads copied the owner's list under the global lock).
+
+Lock-free readers never block, so reader threads compete with writers for
+the GIL on every switch interval, while global-lock readers queue on the
+lock and leave writers more of it. Writes/s with many reader threads is
+therefore a GIL-share figure; compare it together with reads/s.
+
+    uv run python -m benchmarks.project_repository_contention
+    uv run python -m benchmarks.project_repository_contention --owners 1 --readers 16
+"""
+
+from __future__ import annotations
+
+import argparse
+from bisect import insort
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from threading import Barrier, Event, Lock, Thread
+from time import perf_counter, sleep
+from uuid import uuid4
+
+from app.projects.domain.models import Project, ProjectPage
+from app.projects.infrastructure.in_memory_project_repository import InMemoryProjectRepository
+
+PAGE_SIZE = 20
+
+
+class GlobalLockProjectRepository:
+    """The pre-copy-on-write layout, kept here as the comparison baseline."""
+
+    def __init__(self) -> None:
+        self._projects_by_owner: dict[str, list[Project]] = defaultdict(list)
+        self._lock = Lock()
+
+    def list_page_by_owner(self, owner_subject: str, *, limit: int) -> ProjectPage:
+        with self._lock:
+            projects = self._projects_by_owner.get(owner_subject, [])[::-1]
+        return ProjectPage(items=projects[:limit], next_cursor=None)
+
+    def create(self, owner_subject: str, name: str, description: str | None) -> Project:
+        project = Project(
+            id=str(uuid4()),
+            owner_subject=owner_subject,
+            name=name,
+            description=description,
+            created_at=datetime.now(timezone.utc),
+        )
+        with self._lock:
+            insort(
+                self._projects_by_owner[owner_subject],
+                project,
+                key=lambda item: (item.created_at, item.id),
+            )
+        return project
+
+
+@dataclass(slots=True, frozen=True)
+class ContentionResult:
+    name: str
+    reads_per_second: float
+    writes_per_second: float
+
+
+def run_contention(
+    name: str,
+    repository_factory: Callable[[], object],
+    *,
+    owners: int,
+    seed_projects: int,
+    readers: int,
+    writers: int,
+    duration_seconds: float,
+) -> ContentionResult:
+    repository = repository_factory()
+    owner_subjects = [f"owner-{index}" for index in range(owners)]
+    for owner_subject in owner_subjects:
+        for index in range(seed_projects):
+            repository.create(owner_subject, f"seed-{index}", None)
+
+    stop = Event()
+    start = Barrier(readers + writers + 1)
+    read_counts = [0] * readers
+    write_counts = [0] * writers
+
+    def reader(slot: int) -> None:
+        start.wait()
+        count = 0
+        while not stop.is_set():
+            page = repository.list_page_by_owner(owner_subjects[count % owners], limit=PAGE_SIZE)
+            for _project in page.items:
+                pass
+            count += 1
+        read_counts[slot] = count
+
+    def writer(slot: int) -> None:
+        start.wait()
+        count = 0
+        while not stop.is_set():
+            repository.create(owner_subjects[(slot + count) % owners], f"w{slot}-{count}", None)
+            count += 1
+        write_counts[slot] = count
+
+    threads = [Thread(target=reader, args=(slot,)) for slot in range(readers)]
+    threads += [Thread(target=writer, args=(slot,)) for slot in range(writers)]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    started_at = perf_counter()
+    sleep(duration_seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - started_at
+
+    return ContentionResult(
+        name=name,
+        reads_per_second=sum(read_counts) / elapsed,
+        writes_per_second=sum(write_counts) / elapsed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--owners", type=int, default=8)
+    parser.add_argument("--seed-projects", type=int, default=2000)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    repositories: list[tuple[str, Callable[[], object]]] = [
+        ("global-lock", GlobalLockProjectRepository),
+        ("copy-on-write", InMemoryProjectRepository),
+    ]
+    print(
+        f"owners={args.owners} seed={args.seed_projects} "
+        f"readers={args.readers} writers={args.writers}"
+    )
+    print(f"{'repository':<16}{'reads/s':>14}{'writes/s':>14}")
+    for name, factory in repositories:
+        result = run_contention(
+            name,
+            factory,
+            owners=args.owners,
+            seed_projects=args.seed_projects,
+            readers=args.readers,
+            writers=args.writers,
+            duration_seconds=args.duration,
+        )
+        print(f"{result.name:<16}{result.reads_per_second:>14,.0f}{result.writes_per_second:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Event-loop cost of keeping idle browser control SSE streams alive.
+
+Holds --connections idle streams open for --duration seconds and compares the
+previous per-stream `asyncio.wait_for(queue.get(), timeout)` loop with the
+shared keepalive ticker in BrowserControlEventService. A short --interval
+exaggerates the per-keepalive cost so it is measurable in a few seconds.
+Reports CPU time per 10k connections per second, keepalives delivered and
+event-loop lag seen by a probe task.
+
+    uv run python -m benchmarks.sse_keepalive_overhead
+    uv run python -m benchmarks.sse_keepalive_overhead --connections 50000 --interval 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+from collections.abc import Awaitable, Callable
+from time import perf_counter, process_time
+
+from app.browser_control.infrastructure.in_process_event_broker import InProcessEventBroker
+from app.browser_control.services.browser_control_event_service import (
+    BrowserControlEventService,
+    StreamSignal,
+)
+from app.browser_control.services.event_replay_buffer import EventReplayBuffer
+
+PROBE_INTERVAL_SECONDS = 0.01
+QUEUE_MAX_SIZE = 100
+
+
+async def _probe_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        started_at = perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+        lags.append(perf_counter() - started_at - PROBE_INTERVAL_SECONDS)
+
+
+async def _wait_for_streams(
+    connections: int,
+    interval: float,
+    counter: list[int],
+) -> Callable[[], Awaitable[None]]:
+    async def stream(queue: asyncio.Queue) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(queue.get(), timeout=interval)
+            except TimeoutError:
+                counter[0] += 1
+
+    queues = [asyncio.Queue(maxsize=QUEUE_MAX_SIZE) for _ in range(connections)]
+    tasks = [asyncio.create_task(stream(queue)) for queue in queues]
+
+    async def stop() -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return stop
+
+
+async def _shared_ticker_streams(
+    connections: int,
+    interval: float,
+    counter: list[int],
+) -> Callable[[], Awaitable[None]]:
+    service = BrowserControlEventService(
+        broker=InProcessEventBroker(),
+        replay_buffer=EventReplayBuffer(
+            events_per_owner=0,
+            max_events=0,
+            max_age_seconds=1.0,
+        ),
+        keepalive_interval_seconds=interval,
+        queue_max_size=QUEUE_MAX_SIZE,
+        backpressure_policy="drop_oldest",
+    )
+    await service.start()
+
+    async def stream(queue: asyncio.Queue) -> None:
+        while True:
+            if await queue.get() is StreamSignal.KEEPALIVE:
+                counter[0] += 1
+
+    queues = [
+        (await service.subscribe(f"owner-{index % 1000}"))[0]
+        for index in range(connections)
+    ]
+    tasks = [asyncio.create_task(stream(queue)) for queue in queues]
+
+    async def stop() -> None:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await service.close()
+
+    return stop
+
+
+async def _measure(
+    name: str,
+    open_streams: Callable[[int, float, list[int]], Awaitable[Callable[[], Awaitable[None]]]],
+    args: argparse.Namespace,
+) -> None:
+    counter = [0]
+    stop_streams = await open_streams(args.connections, args.interval, counter)
+    # Let every stream reach its first wait before measuring.
+    await asyncio.sleep(0.1)
+
+    lags: list[float] = []
+    stop_probe = asyncio.Event()
+    probe = asyncio.create_task(_probe_lag(stop_probe, lags))
+    cpu_started_at = process_time()
+    await asyncio.sleep(args.duration)
+    cpu_seconds = process_time() - cpu_started_at
+    stop_probe.set()
+    await probe
+    await stop_streams()
+
+    lags.sort()
+    cpu_ms_per_10k = cpu_seconds * 1000 / args.duration * 10_000 / args.connections
+    print(
+        f"{name:<16}{counter[0]:>12,}{cpu_ms_per_10k:>20.1f}"
+        f"{statistics.median(lags) * 1000:>12.2f}{lags[int(len(lags) * 0.99) - 1] * 1000:>12.2f}"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    print(
+        f"{'keepalive':<16}{'keepalives':>12}{'CPU ms/s per 10k':>20}"
+        f"{'lag p50 ms':>12}{'lag p99 ms':>12}"
+    )
+    await _measure("wait_for", _wait_for_streams, args)
+    await _measure("shared ticker", _shared_ticker_streams, args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=10_000)
+    parser.add_argument("--interval", type=float, default=0.5, help="keepalive interval in seconds")
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()